@@ -8,6 +8,26 @@ lyrics (pop songs often contain "oh", "baby", "yeah", etc.).
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+from itertools import chain
+
+# Number of precomposed Hangul syllables (가-힣): 19 onsets × 21 nuclei × 28 codas
+_HANGUL_SYLLABLE_COUNT = 11172
+
+# Hangul syllable runs, or runs of other word characters (punctuation and
+# whitespace match neither group and are skipped). Not [A-Za-z0-9]: the old
+# isalpha/isdigit check also kept non-ASCII letters and digits; _g2p drops
+# the numerics \w adds on top of those, such as '½' and 'Ⅻ'.
+_TOKEN_RE = re.compile(r'([\uac00-\ud7a3]+)|([^\W_\uac00-\ud7a3]+)')
+
+# (onset_idx, nucleus_idx, coda_idx) for every syllable, indexed by
+# ``ord(char) - 0xAC00``.  Built once so decomposition is a single lookup.
+_HANGUL_DECOMP: tuple[tuple[int, int, int], ...] = tuple(
+    (code // (21 * 28), (code % (21 * 28)) // 28, code % 28)
+    for code in range(_HANGUL_SYLLABLE_COUNT)
+)
+
 
 class KoreanG2P:
     """Korean Grapheme-to-Phoneme converter for SOFA forced aligner.
@@ -78,160 +98,150 @@ class KoreanG2P:
     # providing *some* phonemes so the aligner can assign acoustic
     # frames to English words instead of skipping them entirely.
     # ----------------------------------------------------------------
-    _ENGLISH_PHONEME_MAP: dict[str, list[str]] = {
+    _ENGLISH_PHONEME_MAP: dict[str, tuple[str, ...]] = {
         # Consonants — mapped to closest Korean onset/coda
-        'b': ['b'],
-        'c': ['k'],       # hard c → ㅋ
-        'd': ['d'],
-        'f': ['p'],       # no f in Korean; closest labial = ㅍ
-        'g': ['g'],
-        'h': ['h'],
-        'j': ['j'],
-        'k': ['k'],
-        'l': ['L'],       # coda ㄹ
-        'm': ['m'],
-        'n': ['n'],
-        'p': ['p'],
-        'q': ['k'],       # q → k
-        'r': ['r'],
-        's': ['s'],
-        't': ['t'],
-        'v': ['b'],       # no v in Korean; closest = ㅂ
-        'w': ['u'],       # semivowel w → 우
-        'x': ['k', 's'],  # x ≈ ks
-        'z': ['j'],       # z → ㅈ
+        'b': ('b',),
+        'c': ('k',),       # hard c → ㅋ
+        'd': ('d',),
+        'f': ('p',),       # no f in Korean; closest labial = ㅍ
+        'g': ('g',),
+        'h': ('h',),
+        'j': ('j',),
+        'k': ('k',),
+        'l': ('L',),       # coda ㄹ
+        'm': ('m',),
+        'n': ('n',),
+        'p': ('p',),
+        'q': ('k',),       # q → k
+        'r': ('r',),
+        's': ('s',),
+        't': ('t',),
+        'v': ('b',),       # no v in Korean; closest = ㅂ
+        'w': ('u',),       # semivowel w → 우
+        'x': ('k', 's'),  # x ≈ ks
+        'z': ('j',),       # z → ㅈ
         # Vowels — mapped to closest Korean nucleus
-        'a': ['a'],
-        'e': ['e'],
-        'i': ['i'],
-        'o': ['o'],
-        'u': ['u'],
-        'y': ['i'],       # y as vowel → 이
+        'a': ('a',),
+        'e': ('e',),
+        'i': ('i',),
+        'o': ('o',),
+        'u': ('u',),
+        'y': ('i',),       # y as vowel → 이
     }
 
     # Common English words in Korean pop lyrics → pre-defined phoneme
     # sequences for better alignment quality.  These are rough Korean
     # transliterations, not linguistic transcriptions.
-    _ENGLISH_WORD_MAP: dict[str, list[str]] = {
+    _ENGLISH_WORD_MAP: dict[str, tuple[str, ...]] = {
         # Exclamations / fillers
-        'oh':    ['o'],
-        'ah':    ['a'],
-        'uh':    ['eo'],
-        'eh':    ['e'],
-        'ooh':   ['u'],
-        'woo':   ['u'],
-        'whoa':  ['wa'],
-        'wow':   ['wa', 'u'],
-        'hey':   ['h', 'e', 'i'],
-        'yay':   ['ya', 'i'],
-        'yo':    ['yo'],
-        'na':    ['n', 'a'],
-        'la':    ['r', 'a'],
-        'da':    ['d', 'a'],
+        'oh':    ('o',),
+        'ah':    ('a',),
+        'uh':    ('eo',),
+        'eh':    ('e',),
+        'ooh':   ('u',),
+        'woo':   ('u',),
+        'whoa':  ('wa',),
+        'wow':   ('wa', 'u'),
+        'hey':   ('h', 'e', 'i'),
+        'yay':   ('ya', 'i'),
+        'yo':    ('yo',),
+        'na':    ('n', 'a'),
+        'la':    ('r', 'a'),
+        'da':    ('d', 'a'),
         # Common pop words
-        'yeah':  ['ya'],
-        'yeh':   ['ye'],
-        'baby':  ['b', 'e', 'i', 'b', 'i'],
-        'babe':  ['b', 'e', 'i', 'b'],
-        'love':  ['r', 'eo', 'b'],
-        'girl':  ['g', 'eo', 'L'],
-        'boy':   ['b', 'o', 'i'],
-        'my':    ['m', 'a', 'i'],
-        'me':    ['m', 'i'],
-        'you':   ['yu'],
-        'we':    ['wi'],
-        'no':    ['n', 'o'],
-        'go':    ['g', 'o'],
-        'so':    ['s', 'o'],
-        'do':    ['d', 'u'],
-        'know':  ['n', 'o'],
-        'say':   ['s', 'e', 'i'],
-        'stay':  ['s', 'eu', 't', 'e', 'i'],
-        'day':   ['d', 'e', 'i'],
-        'way':   ['u', 'e', 'i'],
-        'come':  ['k', 'eo', 'M'],
-        'one':   ['u', 'a', 'N'],
-        'time':  ['t', 'a', 'i', 'M'],
-        'night': ['n', 'a', 'i', 'T'],
-        'light': ['r', 'a', 'i', 'T'],
-        'right': ['r', 'a', 'i', 'T'],
-        'life':  ['r', 'a', 'i', 'P'],
-        'heart': ['h', 'a', 'T'],
-        'stop':  ['s', 'eu', 't', 'a', 'P'],
-        'feel':  ['p', 'i', 'L'],
-        'real':  ['r', 'i', 'eo', 'L'],
-        'fly':   ['p', 'eu', 'r', 'a', 'i'],
-        'cry':   ['k', 'eu', 'r', 'a', 'i'],
-        'try':   ['t', 'eu', 'r', 'a', 'i'],
-        'why':   ['u', 'a', 'i'],
-        'high':  ['h', 'a', 'i'],
-        'fire':  ['p', 'a', 'i', 'eo'],
-        'more':  ['m', 'o', 'eo'],
-        'like':  ['r', 'a', 'i', 'K'],
-        'take':  ['t', 'e', 'i', 'K'],
-        'make':  ['m', 'e', 'i', 'K'],
-        'break': ['b', 'eu', 'r', 'e', 'i', 'K'],
-        'dance': ['d', 'ae', 'N', 's', 'eu'],
-        'chance':['ch', 'ae', 'N', 's', 'eu'],
-        'forever': ['p', 'o', 'r', 'e', 'b', 'eo'],
-        'never': ['n', 'e', 'b', 'eo'],
-        'ever':  ['e', 'b', 'eo'],
-        'over':  ['o', 'b', 'eo'],
-        'under': ['eo', 'N', 'd', 'eo'],
-        'away':  ['eo', 'u', 'e', 'i'],
-        'tonight': ['t', 'u', 'n', 'a', 'i', 'T'],
-        'alright': ['o', 'L', 'r', 'a', 'i', 'T'],
-        'hello': ['h', 'e', 'L', 'r', 'o'],
-        'world': ['u', 'eo', 'L', 'd', 'eu'],
-        'only':  ['o', 'N', 'r', 'i'],
-        'just':  ['j', 'eo', 's', 'eu', 'T'],
-        'wanna': ['u', 'a', 'n', 'a'],
-        'gonna': ['g', 'o', 'n', 'a'],
-        'gotta': ['g', 'a', 't', 'a'],
-        'lala':  ['r', 'a', 'r', 'a'],
-        'lalala':['r', 'a', 'r', 'a', 'r', 'a'],
-        'nanana':['n', 'a', 'n', 'a', 'n', 'a'],
+        'yeah':  ('ya',),
+        'yeh':   ('ye',),
+        'baby':  ('b', 'e', 'i', 'b', 'i'),
+        'babe':  ('b', 'e', 'i', 'b'),
+        'love':  ('r', 'eo', 'b'),
+        'girl':  ('g', 'eo', 'L'),
+        'boy':   ('b', 'o', 'i'),
+        'my':    ('m', 'a', 'i'),
+        'me':    ('m', 'i'),
+        'you':   ('yu',),
+        'we':    ('wi',),
+        'no':    ('n', 'o'),
+        'go':    ('g', 'o'),
+        'so':    ('s', 'o'),
+        'do':    ('d', 'u'),
+        'know':  ('n', 'o'),
+        'say':   ('s', 'e', 'i'),
+        'stay':  ('s', 'eu', 't', 'e', 'i'),
+        'day':   ('d', 'e', 'i'),
+        'way':   ('u', 'e', 'i'),
+        'come':  ('k', 'eo', 'M'),
+        'one':   ('u', 'a', 'N'),
+        'time':  ('t', 'a', 'i', 'M'),
+        'night': ('n', 'a', 'i', 'T'),
+        'light': ('r', 'a', 'i', 'T'),
+        'right': ('r', 'a', 'i', 'T'),
+        'life':  ('r', 'a', 'i', 'P'),
+        'heart': ('h', 'a', 'T'),
+        'stop':  ('s', 'eu', 't', 'a', 'P'),
+        'feel':  ('p', 'i', 'L'),
+        'real':  ('r', 'i', 'eo', 'L'),
+        'fly':   ('p', 'eu', 'r', 'a', 'i'),
+        'cry':   ('k', 'eu', 'r', 'a', 'i'),
+        'try':   ('t', 'eu', 'r', 'a', 'i'),
+        'why':   ('u', 'a', 'i'),
+        'high':  ('h', 'a', 'i'),
+        'fire':  ('p', 'a', 'i', 'eo'),
+        'more':  ('m', 'o', 'eo'),
+        'like':  ('r', 'a', 'i', 'K'),
+        'take':  ('t', 'e', 'i', 'K'),
+        'make':  ('m', 'e', 'i', 'K'),
+        'break': ('b', 'eu', 'r', 'e', 'i', 'K'),
+        'dance': ('d', 'ae', 'N', 's', 'eu'),
+        'chance':('ch', 'ae', 'N', 's', 'eu'),
+        'forever': ('p', 'o', 'r', 'e', 'b', 'eo'),
+        'never': ('n', 'e', 'b', 'eo'),
+        'ever':  ('e', 'b', 'eo'),
+        'over':  ('o', 'b', 'eo'),
+        'under': ('eo', 'N', 'd', 'eo'),
+        'away':  ('eo', 'u', 'e', 'i'),
+        'tonight': ('t', 'u', 'n', 'a', 'i', 'T'),
+        'alright': ('o', 'L', 'r', 'a', 'i', 'T'),
+        'hello': ('h', 'e', 'L', 'r', 'o'),
+        'world': ('u', 'eo', 'L', 'd', 'eu'),
+        'only':  ('o', 'N', 'r', 'i'),
+        'just':  ('j', 'eo', 's', 'eu', 'T'),
+        'wanna': ('u', 'a', 'n', 'a'),
+        'gonna': ('g', 'o', 'n', 'a'),
+        'gotta': ('g', 'a', 't', 'a'),
+        'lala':  ('r', 'a', 'r', 'a'),
+        'lalala':('r', 'a', 'r', 'a', 'r', 'a'),
+        'nanana':('n', 'a', 'n', 'a', 'n', 'a'),
     }
 
     def __init__(self, **kwargs: object) -> None:
         pass
 
-    def _english_char_to_phonemes(self, char: str) -> list[str]:
+    def _english_char_to_phonemes(self, char: str) -> tuple[str, ...]:
         """Map a single English letter to approximate Korean phoneme(s).
 
         Args:
             char: A single ASCII letter (already lowercased by caller).
 
         Returns:
-            List of Korean phonemes.  Empty list for unmappable chars.
+            Tuple of Korean phonemes (shared, do not mutate).  Empty tuple
+            for unmappable chars.
         """
-        return list(self._ENGLISH_PHONEME_MAP.get(char.lower(), []))
+        return self._ENGLISH_PHONEME_MAP.get(char.lower(), ())
 
-    def _english_word_to_phonemes(self, word: str) -> list[str]:
+    def _english_word_to_phonemes(self, word: str) -> tuple[str, ...]:
         """Convert an English word to approximate Korean phonemes.
 
         First checks the common-word lookup table, then falls back to
-        per-character mapping.
+        per-character mapping.  Results are memoized per lowercased word,
+        since fillers like "oh" and "baby" repeat throughout a song.
 
         Args:
             word: An English word (may contain mixed case).
 
         Returns:
-            List of Korean phonemes.
+            Tuple of Korean phonemes (shared, do not mutate).
         """
-        lower = word.lower()
-
-        # 1. Check exact match in common word table
-        if lower in self._ENGLISH_WORD_MAP:
-            return list(self._ENGLISH_WORD_MAP[lower])
-
-        # 2. Per-character fallback
-        phonemes: list[str] = []
-        for ch in lower:
-            mapped = self._ENGLISH_PHONEME_MAP.get(ch)
-            if mapped:
-                phonemes.extend(mapped)
-        return phonemes
+        return _english_word_phonemes(word.lower())
 
     def _g2p(self, input_text: str) -> tuple[list[str], list[str], list[int]]:
         """Convert Korean text to SOFA phoneme sequence.
@@ -263,81 +273,59 @@ class KoreanG2P:
 
         for word_idx, word in enumerate(words):
             word_seq.append(word)
-
-            # Separate the word into runs of Hangul vs non-Hangul
-            hangul_phonemes: list[str] = []
-            non_hangul_chars: list[str] = []
-
-            for char in word:
-                if self._is_hangul(char):
-                    # Flush any pending non-Hangul characters first
-                    if non_hangul_chars:
-                        eng_phs = self._english_word_to_phonemes(
-                            ''.join(non_hangul_chars)
-                        )
-                        if eng_phs:
-                            ph_seq.extend(eng_phs)
-                            ph_idx_to_word_idx.extend(
-                                [word_idx] * len(eng_phs)
-                            )
-                        non_hangul_chars = []
-
-                    phonemes = self._syllable_to_phonemes(char)
-                    ph_seq.extend(phonemes)
-                    ph_idx_to_word_idx.extend([word_idx] * len(phonemes))
-                elif char.isalpha() or char.isdigit():
-                    non_hangul_chars.append(char)
-                # Pure punctuation is still skipped
+            word_ph_start = len(ph_seq)
+
+            # Split the word into Hangul runs and letter/digit runs with one
+            # regex scan.  Punctuation is skipped but does not break a Latin
+            # run, so "oh-yeah" is still looked up as "ohyeah".
+            non_hangul_runs: list[str] = []
+
+            for match in _TOKEN_RE.finditer(word):
+                hangul_run = match.group(1)
+                if hangul_run is None:
+                    run = match.group(2)
+                    if not run.isalpha():
+                        # \w also matches numerics such as '½' or 'Ⅻ'; keep
+                        # only letters and digits
+                        run = ''.join(c for c in run if c.isalpha() or c.isdigit())
+                    non_hangul_runs.append(run)
+                    continue
+
+                # Flush any pending non-Hangul characters first
+                if non_hangul_runs:
+                    ph_seq.extend(
+                        self._english_word_to_phonemes(''.join(non_hangul_runs))
+                    )
+                    non_hangul_runs = []
+
+                for char in hangul_run:
+                    ph_seq.extend(_SYLLABLE_PHONEMES[ord(char) - 0xAC00])
 
             # Flush remaining non-Hangul chars at end of word
-            if non_hangul_chars:
-                eng_phs = self._english_word_to_phonemes(
-                    ''.join(non_hangul_chars)
+            if non_hangul_runs:
+                ph_seq.extend(
+                    self._english_word_to_phonemes(''.join(non_hangul_runs))
                 )
-                if eng_phs:
-                    ph_seq.extend(eng_phs)
-                    ph_idx_to_word_idx.extend([word_idx] * len(eng_phs))
 
             # If the word produced zero phonemes (e.g., pure punctuation),
             # add a minimal vowel phoneme so the aligner can still place it
-            word_phoneme_count = sum(
-                1 for idx in ph_idx_to_word_idx if idx == word_idx
-            )
-            if word_phoneme_count == 0:
+            if len(ph_seq) == word_ph_start:
                 ph_seq.append('eo')  # schwa-like fallback
-                ph_idx_to_word_idx.append(word_idx)
+
+            ph_idx_to_word_idx.extend([word_idx] * (len(ph_seq) - word_ph_start))
 
             # Add SP separator after each word
             ph_seq.append('SP')
             ph_idx_to_word_idx.append(-1)
 
-        # Ensure exactly one trailing SP (don't double up)
-        while len(ph_seq) >= 2 and ph_seq[-1] == 'SP' and ph_seq[-2] == 'SP':
-            _ = ph_seq.pop()
-            _ = ph_idx_to_word_idx.pop()
-
-        # Ensure the sequence ends with SP
+        # Every word emits at least one phoneme followed by a single SP, so
+        # the sequence never contains consecutive SPs and already ends with
+        # SP; keep the terminal guard in case that invariant ever changes.
         if ph_seq[-1] != 'SP':
             ph_seq.append('SP')
             ph_idx_to_word_idx.append(-1)
 
-        # Clean up: ensure no more than 2 consecutive SP anywhere
-        cleaned_ph: list[str] = []
-        cleaned_idx: list[int] = []
-        consecutive_sp = 0
-
-        for ph, idx in zip(ph_seq, ph_idx_to_word_idx):
-            if ph == 'SP':
-                consecutive_sp += 1
-                if consecutive_sp <= 2:
-                    cleaned_ph.append(ph)
-                    cleaned_idx.append(idx)
-            else:
-                consecutive_sp = 0
-                cleaned_ph.append(ph)
-                cleaned_idx.append(idx)
-
-        return (cleaned_ph, word_seq, cleaned_idx)
+        return (ph_seq, word_seq, ph_idx_to_word_idx)
 
     @staticmethod
     def _is_hangul(char: str) -> bool:
@@ -349,7 +337,7 @@ class KoreanG2P:
     def _decompose(char: str) -> tuple[int, int, int] | None:
         """Decompose a Hangul syllable into (onset_idx, nucleus_idx, coda_idx).
 
-        Uses Unicode arithmetic:
+        Looks up the precomputed Unicode arithmetic:
             syllable_code = (onset * 21 + nucleus) * 28 + coda + 0xAC00
 
         Args:
@@ -359,41 +347,69 @@ class KoreanG2P:
             Tuple of (onset_idx, nucleus_idx, coda_idx) or None if not Hangul.
         """
         code = ord(char) - 0xAC00
-        if code < 0 or code > 11171:
-            return None
-        onset = code // (21 * 28)
-        nucleus = (code % (21 * 28)) // 28
-        coda = code % 28
-        return (onset, nucleus, coda)
+        if 0 <= code < _HANGUL_SYLLABLE_COUNT:
+            return _HANGUL_DECOMP[code]
+        return None
 
-    def _syllable_to_phonemes(self, char: str) -> list[str]:
-        """Convert a single Hangul syllable to a list of phonemes.
+    @classmethod
+    def _indices_to_phonemes(
+        cls, onset_idx: int, nucleus_idx: int, coda_idx: int
+    ) -> tuple[str, ...]:
+        """Assemble the phoneme tuple for decomposed syllable indices.
 
-        Args:
-            char: A single Hangul syllable character.
-
-        Returns:
-            List of phoneme strings for this syllable.
+        Used once at import time to build ``_SYLLABLE_PHONEMES``.
         """
-        result = self._decompose(char)
-        if result is None:
-            return []
-
-        onset_idx, nucleus_idx, coda_idx = result
         phonemes: list[str] = []
 
         # Onset — skip silent ㅇ (index 11, which maps to empty string)
-        onset = self.ONSET_PHONEMES[onset_idx]
+        onset = cls.ONSET_PHONEMES[onset_idx]
         if onset:
             phonemes.append(onset)
 
         # Nucleus — always present
-        phonemes.append(self.NUCLEUS_PHONEMES[nucleus_idx])
+        phonemes.append(cls.NUCLEUS_PHONEMES[nucleus_idx])
 
         # Coda — skip if index 0 (no coda)
         if coda_idx > 0:
-            coda = self.CODA_PHONEMES[coda_idx]
+            coda = cls.CODA_PHONEMES[coda_idx]
             if coda:
                 phonemes.append(coda)
 
-        return phonemes
+        return tuple(phonemes)
+
+    def _syllable_to_phonemes(self, char: str) -> list[str]:
+        """Convert a single Hangul syllable to a list of phonemes.
+
+        Args:
+            char: A single Hangul syllable character.
+
+        Returns:
+            List of phoneme strings for this syllable.
+        """
+        code = ord(char) - 0xAC00
+        if 0 <= code < _HANGUL_SYLLABLE_COUNT:
+            return list(_SYLLABLE_PHONEMES[code])
+        return []
+
+
+# Phoneme tuple for every Hangul syllable, indexed by ``ord(char) - 0xAC00``.
+_SYLLABLE_PHONEMES: tuple[tuple[str, ...], ...] = tuple(
+    KoreanG2P._indices_to_phonemes(*indices) for indices in _HANGUL_DECOMP
+)
+
+
+@lru_cache(maxsize=4096)
+def _english_word_phonemes(lower: str) -> tuple[str, ...]:
+    """Memoized body of ``KoreanG2P._english_word_to_phonemes``.
+
+    Args:
+        lower: An already-lowercased English word.
+    """
+    # 1. Check exact match in common word table
+    mapped_word = KoreanG2P._ENGLISH_WORD_MAP.get(lower)
+    if mapped_word is not None:
+        return mapped_word
+
+    # 2. Per-character fallback
+    char_map = KoreanG2P._ENGLISH_PHONEME_MAP
+    return tuple(chain.from_iterable(char_map.get(ch, ()) for ch in lower))
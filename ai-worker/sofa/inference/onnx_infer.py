@@ -65,76 +65,107 @@ def _get_forward_pass():
 
         All arguments are modified in-place and returned.
         """
-        for t in range(1, T):
-            # --- prob1: stay in same phoneme [t-1, s] -> [t, s] ---
-            prob1 = dp[t - 1, :] + prob_log[t, :] + not_edge_prob_log[t]
-
-            # --- prob2: transition to next phoneme [t-1, s-1] -> [t, s] ---
-            prob2 = np.empty(S, dtype=np.float32)
-            prob2[0] = -np.inf
-            for i in range(1, S):
-                prob2[i] = (
-                    dp[t - 1, i - 1]
-                    + prob_log[t, i - 1]
-                    + edge_prob_log[t]
-                    + curr_ph_max_prob_log[i - 1] * (T / S)
-                )
-
-            # --- prob3: skip SP phoneme [t-1, s-2] -> [t, s] ---
-            prob3 = np.empty(S, dtype=np.float32)
-            for i in range(prob3_pad_len):
-                prob3[i] = -np.inf
-            for i in range(prob3_pad_len, S):
-                if (
-                    i - prob3_pad_len + 1 < S - 1
-                    and ph_seq_id[i - prob3_pad_len + 1] != 0
-                ):
-                    prob3[i] = -np.inf
-                else:
-                    prob3[i] = (
-                        dp[t - 1, i - prob3_pad_len]
-                        + prob_log[t, i - prob3_pad_len]
-                        + edge_prob_log[t]
-                        + curr_ph_max_prob_log[i - prob3_pad_len] * (T / S)
-                    )
+        # Each state has at most three predecessors, so the sweep is
+        # O(T * S). Scalars are written straight into dp / backtrack_s
+        # instead of building per-frame temporaries.
+        len_scale = T / S
 
-            # --- select best transition for each state ---
-            stacked_probs = np.empty((3, S), dtype=np.float32)
-            for i in range(S):
-                stacked_probs[0, i] = prob1[i]
-                stacked_probs[1, i] = prob2[i]
-                stacked_probs[2, i] = prob3[i]
+        # prob3 is only allowed when the skipped phoneme is SP
+        allow_skip = np.zeros(S, dtype=np.bool_)
+        for i in range(prob3_pad_len, S):
+            j = i - prob3_pad_len
+            allow_skip[i] = not (j + 1 < S - 1 and ph_seq_id[j + 1] != 0)
 
+        for t in range(1, T):
             for i in range(S):
+                # --- prob1: stay in same phoneme [t-1, s] -> [t, s] ---
+                max_val = dp[t - 1, i] + prob_log[t, i] + not_edge_prob_log[t]
                 max_idx = 0
-                max_val = stacked_probs[0, i]
-                for j in range(1, 3):
-                    if stacked_probs[j, i] > max_val:
-                        max_val = stacked_probs[j, i]
-                        max_idx = j
+
+                # --- prob2: transition to next phoneme [t-1, s-1] -> [t, s] ---
+                if i >= 1:
+                    prob2 = np.float32(
+                        dp[t - 1, i - 1]
+                        + prob_log[t, i - 1]
+                        + edge_prob_log[t]
+                        + curr_ph_max_prob_log[i - 1] * len_scale
+                    )
+                    if prob2 > max_val:
+                        max_val = prob2
+                        max_idx = 1
+
+                # --- prob3: skip SP phoneme [t-1, s-2] -> [t, s] ---
+                if allow_skip[i]:
+                    j = i - prob3_pad_len
+                    prob3 = np.float32(
+                        dp[t - 1, j]
+                        + prob_log[t, j]
+                        + edge_prob_log[t]
+                        + curr_ph_max_prob_log[j] * len_scale
+                    )
+                    if prob3 > max_val:
+                        max_val = prob3
+                        max_idx = 2
+
+                # --- select best transition for each state ---
                 dp[t, i] = max_val
                 backtrack_s[t, i] = max_idx
 
             # --- update running max log-prob for current phoneme ---
             for i in range(S):
-                if backtrack_s[t, i] == 0:
+                if ph_seq_id[i] == 0:
+                    # reset SP phoneme max prob (SP = index 0)
+                    curr_ph_max_prob_log[i] = 0
+                elif backtrack_s[t, i] == 0:
                     curr_ph_max_prob_log[i] = max(
                         curr_ph_max_prob_log[i], prob_log[t, i]
                     )
-                elif backtrack_s[t, i] > 0:
+                else:
                     curr_ph_max_prob_log[i] = prob_log[t, i]
 
-            # --- reset SP phoneme max prob (SP = index 0) ---
-            for i in range(S):
-                if ph_seq_id[i] == 0:
-                    curr_ph_max_prob_log[i] = 0
-
         return dp, backtrack_s, curr_ph_max_prob_log
 
     _forward_pass_compiled = forward_pass
     return _forward_pass_compiled
 
 
+_backward_pass_compiled = None
+
+
+def _get_backward_pass():
+    """Lazy-compile the numba-optimized Viterbi backtrack."""
+    global _backward_pass_compiled
+    if _backward_pass_compiled is not None:
+        return _backward_pass_compiled
+
+    import numba  # noqa: F811
+
+    @numba.njit
+    def backward_pass(dp: np.ndarray, backtrack_s: np.ndarray, s: int):
+        """Follow backtrack_s from state *s* at the last frame to frame 0.
+
+        Returns the state and frame index where each segment begins, plus
+        the cumulative log-prob along the path, all in forward order.
+        """
+        T = dp.shape[0]
+        ph_idx_seq = np.empty(T, dtype=np.int64)
+        ph_time_int = np.empty(T, dtype=np.int64)
+        path_prob_log = np.empty(T, dtype=np.float64)
+        n = 0
+        for t in range(T - 1, -1, -1):
+            assert backtrack_s[t, s] >= 0 or t == 0
+            path_prob_log[t] = dp[t, s]
+            if backtrack_s[t, s] != 0:
+                ph_idx_seq[n] = s
+                ph_time_int[n] = t
+                n += 1
+                s -= backtrack_s[t, s]
+        return ph_idx_seq[:n][::-1].copy(), ph_time_int[:n][::-1].copy(), path_prob_log
+
+    _backward_pass_compiled = backward_pass
+    return _backward_pass_compiled
+
+
 # ---------------------------------------------------------------------------
 # Viterbi decode (forward + backward)
 # ---------------------------------------------------------------------------
@@ -174,7 +205,8 @@ def _decode(
     # --- Initialise DP tables ---
     curr_ph_max_prob_log = np.full(S, -np.inf)
     dp = np.full((T, S), -np.inf, dtype=np.float32)
-    backtrack_s = np.full_like(dp, -1, dtype=np.int32)
+    # Transition choice is -1..2; int8 keeps this (T, S) table 4x smaller
+    backtrack_s = np.full_like(dp, -1, dtype=np.int8)
 
     dp[0, 0] = prob_log[0, 0]
     curr_ph_max_prob_log[0] = prob_log[0, 0]
@@ -199,28 +231,15 @@ def _decode(
         prob3_pad_len,
     )
 
-    # --- Backward pass ---
-    ph_idx_seq: list[int] = []
-    ph_time_int: list[int] = []
-    frame_confidence: list[float] = []
-
+    # --- Backward pass (numba-optimized) ---
     # Forced mode: can only end on last phoneme, or second-to-last if last is SP
     if S >= 2 and dp[-1, -2] > dp[-1, -1] and ph_seq_id[-1] == 0:
         s = S - 2
     else:
         s = S - 1
 
-    for t in range(T - 1, -1, -1):
-        assert backtrack_s[t, s] >= 0 or t == 0
-        frame_confidence.append(float(dp[t, s]))
-        if backtrack_s[t, s] != 0:
-            ph_idx_seq.append(s)
-            ph_time_int.append(t)
-            s -= int(backtrack_s[t, s])
-
-    ph_idx_seq.reverse()
-    ph_time_int.reverse()
-    frame_confidence.reverse()
+    backward_pass = _get_backward_pass()
+    ph_idx_seq, ph_time_int, frame_confidence = backward_pass(dp, backtrack_s, s)
 
     # Convert cumulative log-probs to per-frame confidence
     frame_confidence_arr = np.exp(
@@ -230,11 +249,7 @@ def _decode(
         )
     )
 
-    return (
-        np.array(ph_idx_seq),
-        np.array(ph_time_int),
-        frame_confidence_arr,
-    )
+    return ph_idx_seq, ph_time_int, frame_confidence_arr
 
 
 # ---------------------------------------------------------------------------
@@ -279,6 +294,7 @@ class SOFAOnnxInfer:
         self._hop_length = hop_length
         self._scale_factor = scale_factor
         self._session: ort.InferenceSession | None = None
+        self._run_options: ort.RunOptions | None = None
 
     # ------------------------------------------------------------------
     # ONNX session management
@@ -292,7 +308,21 @@ class SOFAOnnxInfer:
         import onnxruntime as ort  # noqa: F811
 
         if self._device == "cuda":
-            providers = ["CUDAExecutionProvider", "CPUExecutionProvider"]
+            # Every song has a different waveform length, so the default
+            # EXHAUSTIVE cuDNN conv search would re-benchmark on each call;
+            # the heuristic pick avoids that per-shape warmup.
+            # kSameAsRequested lets the per-run arena shrink (set up below)
+            # hand a song's activation memory back instead of keeping it.
+            providers = [
+                (
+                    "CUDAExecutionProvider",
+                    {
+                        "cudnn_conv_algo_search": "HEURISTIC",
+                        "arena_extend_strategy": "kSameAsRequested",
+                    },
+                ),
+                "CPUExecutionProvider",
+            ]
         else:
             providers = ["CPUExecutionProvider"]
 
@@ -312,6 +342,17 @@ class SOFAOnnxInfer:
             self._model_path,
             providers,
         )
+
+        # The session stays loaded between songs; shrink the GPU arena after
+        # each run so an idle session only holds its weights. Built once here
+        # for the device the CUDA provider actually bound to.
+        cuda_options = self._session.get_provider_options().get("CUDAExecutionProvider")
+        if cuda_options is not None:
+            self._run_options = ort.RunOptions()
+            self._run_options.add_run_config_entry(
+                "memory.enable_memory_arena_shrinkage",
+                f"gpu:{cuda_options.get('device_id', '0')}",
+            )
         return self._session
 
     def _run_model(
@@ -334,14 +375,16 @@ class SOFAOnnxInfer:
         session = self._get_session()
         output_names = [o.name for o in session.get_outputs()]
 
-        # Model expects batched inputs: waveform [1, samples], ph_seq_id [1, S]
+        # Model expects batched inputs: waveform [1, samples], ph_seq_id [1, S].
+        # Add the batch axis as a view — wrapping in a list, or astype on an
+        # already-float32 chunk, would copy the whole waveform first.
         input_data = {
-            "waveform": [waveform.astype(np.float32)],
+            "waveform": np.ascontiguousarray(waveform, dtype=np.float32)[np.newaxis],
             "num_frames": np.array(num_frames, dtype=np.int64),
-            "ph_seq_id": [ph_seq_id],
+            "ph_seq_id": ph_seq_id[np.newaxis],
         }
 
-        results = session.run(output_names, input_data)
+        results = session.run(output_names, input_data, self._run_options)
         return dict(zip(output_names, results))
 
     # ------------------------------------------------------------------
@@ -420,6 +463,7 @@ class SOFAOnnxInfer:
         if self._session is not None:
             del self._session
             self._session = None
+            self._run_options = None
             logger.info("Released ONNX session")
 
     def __del__(self) -> None:
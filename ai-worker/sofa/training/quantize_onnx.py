@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""Produce an INT8 (dynamically quantized) copy of the SOFA ONNX model.
+
+The FP32 graph is memory-bandwidth bound on CPU; dynamic quantization
+stores weights as INT8 and quantizes activations on the fly, which
+roughly halves CPU inference time and shrinks the model ~4x.
+
+The mel frontend baked into the graph (STFT / filterbank up to the log
+compression) is kept in FP32: quantizing the DFT and mel weights shifts
+the spectrogram itself, and every boundary downstream with it.
+
+The quantized model is written next to the input as ``<stem>_int8.onnx``
+(e.g. ``sofa_korean_int8.onnx``). ``SOFAAligner`` picks it up
+automatically when running on CPU (``SOFA_USE_INT8=false`` turns that
+off). With ``--check-csv`` the INT8 model is aligned against the FP32
+one on reference clips and deleted if the phoneme boundaries drift too
+far.
+
+Usage:
+    python quantize_onnx.py                       # sofa/models/sofa_korean.onnx
+    python quantize_onnx.py --input model.onnx --output model_int8.onnx
+    python quantize_onnx.py --check-csv data/full_label/transcriptions.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import logging
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Allow importing the SOFA inference engine from the project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = (
+    Path(__file__).resolve().parent.parent / "models" / "sofa_korean.onnx"
+)
+DEFAULT_CONFIG = (
+    Path(__file__).resolve().parent.parent / "models" / "sofa_korean_config.yaml"
+)
+DEFAULT_OP_TYPES = "MatMul,Conv,Gemm"
+
+
+def int8_model_path(model_path: Path) -> Path:
+    """Return the conventional INT8 sibling path for *model_path*."""
+    return model_path.with_name(f"{model_path.stem}_int8{model_path.suffix}")
+
+
+def find_frontend_nodes(model_path: Path, input_name: str = "waveform") -> list[str]:
+    """Return the names of the mel frontend nodes in the exported graph.
+
+    The frontend is everything the first ``Log`` node computed from the
+    waveform input depends on (STFT/DFT conv, power, mel filterbank matmul,
+    clamp). ONNX graphs are stored in topological order, so the first such
+    ``Log`` in ``graph.node`` is the log-mel compression.
+
+    Args:
+        model_path: FP32 ONNX model.
+        input_name: Name of the raw-audio graph input.
+
+    Returns:
+        Node names to exclude from quantization, or an empty list if no
+        log-mel node was found.
+    """
+    import onnx
+
+    graph = onnx.load(str(model_path), load_external_data=False).graph
+
+    producer = {}
+    for node in graph.node:
+        for out in node.output:
+            producer[out] = node
+
+    # Forward pass: first Log reachable from the waveform
+    tainted = {input_name}
+    log_node = None
+    for node in graph.node:
+        if any(name in tainted for name in node.input):
+            tainted.update(node.output)
+            if node.op_type == "Log":
+                log_node = node
+                break
+    if log_node is None:
+        return []
+
+    # Backward pass: every node the log-mel output depends on
+    frontend: dict[str, None] = {}
+    stack = [log_node]
+    seen = set()
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if node.name:
+            frontend[node.name] = None
+        stack.extend(producer[name] for name in node.input if name in producer)
+    return list(frontend)
+
+
+def _load_reference_clips(csv_path: Path, limit: int) -> list[tuple[Path, list[str]]]:
+    """Read up to *limit* ``(wav_path, ph_seq)`` pairs from a SOFA transcriptions.csv."""
+    wav_dir = csv_path.parent / "wavs"
+    clips = []
+    with open(csv_path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            wav_path = wav_dir / f"{row['name']}.wav"
+            if wav_path.is_file():
+                clips.append((wav_path, row["ph_seq"].split()))
+            if len(clips) >= limit:
+                break
+    return clips
+
+
+def check_accuracy(
+    fp32_path: Path,
+    int8_path: Path,
+    csv_path: Path,
+    config_path: Path,
+    num_clips: int,
+    max_mean_delta_ms: float,
+) -> bool:
+    """Align reference clips with both models and compare phoneme boundaries.
+
+    SP may be skipped by the decoder, so only the non-SP phonemes (which
+    the forced alignment always keeps) are compared, start and end.
+
+    Returns:
+        True if the mean absolute boundary delta is within
+        *max_mean_delta_ms*.
+    """
+    import soundfile as sf
+    import yaml
+
+    from sofa.inference.onnx_infer import SOFAOnnxInfer
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+    ph_to_idx = {
+        key: value
+        for key, value in (config.get("vocab") or {}).items()
+        if isinstance(key, str) and isinstance(value, int) and not key.startswith("<")
+    }
+    scale_factor = float((config.get("melspec_config") or {}).get("scale_factor", 1.0))
+
+    clips = _load_reference_clips(csv_path, num_clips)
+    if not clips:
+        logger.error("No reference clips found via %s", csv_path)
+        return False
+
+    engines = [
+        SOFAOnnxInfer(str(path), device="cpu", scale_factor=scale_factor)
+        for path in (fp32_path, int8_path)
+    ]
+    deltas = []
+    try:
+        for wav_path, ph_seq in clips:
+            waveform, sr = sf.read(str(wav_path), dtype="float32", always_2d=True)
+            waveform = waveform.mean(axis=1)
+            if sr != 44100:
+                import soxr
+
+                waveform = soxr.resample(waveform, sr, 44100).astype(np.float32)
+
+            bounds = []
+            for engine in engines:
+                segments = engine.infer(waveform, ph_seq, ph_to_idx)
+                bounds.append(
+                    np.array(
+                        [(start, end) for ph, start, end in segments if ph != "SP"],
+                        dtype=np.float64,
+                    )
+                )
+            delta_ms = np.abs(bounds[0] - bounds[1]) * 1000.0
+            deltas.append(delta_ms.ravel())
+            logger.info(
+                "  %s: mean %.1f ms, max %.1f ms",
+                wav_path.name, delta_ms.mean(), delta_ms.max(),
+            )
+    finally:
+        for engine in engines:
+            engine.release()
+
+    all_deltas = np.concatenate(deltas)
+    mean_ms = float(all_deltas.mean()) if all_deltas.size else 0.0
+    logger.info(
+        "Boundary delta INT8 vs FP32 over %d clips: mean %.1f ms, p95 %.1f ms (limit %.1f ms)",
+        len(clips),
+        mean_ms,
+        float(np.percentile(all_deltas, 95)) if all_deltas.size else 0.0,
+        max_mean_delta_ms,
+    )
+    return mean_ms <= max_mean_delta_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Dynamically quantize the SOFA ONNX model to INT8 for CPU inference.",
+    )
+    parser.add_argument(
+        "--input",
+        type=str,
+        default=str(DEFAULT_MODEL),
+        help="FP32 ONNX model (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Output path (default: <input stem>_int8.onnx next to the input)",
+    )
+    parser.add_argument(
+        "--op-types",
+        type=str,
+        default=DEFAULT_OP_TYPES,
+        help="Comma-separated op types to quantize (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--exclude-nodes",
+        type=str,
+        default="",
+        help="Comma-separated node names to keep in FP32, in addition to the mel frontend",
+    )
+    parser.add_argument(
+        "--quantize-frontend",
+        action="store_true",
+        help="Also quantize the mel frontend (excluded by default)",
+    )
+    parser.add_argument(
+        "--check-csv",
+        type=str,
+        default=None,
+        help="SOFA transcriptions.csv (with wavs/ next to it) to compare INT8 against FP32 on",
+    )
+    parser.add_argument(
+        "--check-clips",
+        type=int,
+        default=5,
+        help="Number of reference clips to align (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-mean-delta-ms",
+        type=float,
+        default=10.0,
+        help="Largest acceptable mean boundary delta (default: %(default)s ms)",
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        default=str(DEFAULT_CONFIG),
+        help="Model config YAML with vocab and melspec_config (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%H:%M:%S",
+    )
+
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    input_path = Path(args.input)
+    if not input_path.is_file():
+        logger.error("ONNX model not found: %s", input_path)
+        sys.exit(1)
+    output_path = Path(args.output) if args.output else int8_model_path(input_path)
+
+    op_types = [op for op in args.op_types.split(",") if op]
+    exclude = [name for name in args.exclude_nodes.split(",") if name]
+    if not args.quantize_frontend:
+        frontend = find_frontend_nodes(input_path)
+        if frontend:
+            logger.info("Keeping %d mel frontend nodes in FP32", len(frontend))
+        else:
+            logger.warning("No log-mel node found; the whole graph will be quantized")
+        exclude += [name for name in frontend if name not in exclude]
+
+    logger.info("Quantizing %s → %s (ops: %s)", input_path, output_path, op_types)
+    quantize_dynamic(
+        str(input_path),
+        str(output_path),
+        op_types_to_quantize=op_types,
+        per_channel=True,
+        weight_type=QuantType.QInt8,
+        nodes_to_exclude=exclude or None,
+    )
+
+    in_mb = input_path.stat().st_size / 1e6
+    out_mb = output_path.stat().st_size / 1e6
+    logger.info("Done: %.1f MB → %.1f MB", in_mb, out_mb)
+
+    if args.check_csv:
+        ok = check_accuracy(
+            input_path,
+            output_path,
+            Path(args.check_csv),
+            Path(args.config),
+            args.check_clips,
+            args.max_mean_delta_ms,
+        )
+        if not ok:
+            output_path.unlink()
+            logger.error("INT8 model failed the accuracy check; removed %s", output_path)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -162,9 +162,22 @@ echo "[Step 10] Copying ONNX model to ai-worker..."
 mkdir -p "$AI_WORKER_DIR/sofa/models"
 cp "$ONNX_MODEL" "$AI_WORKER_DIR/sofa/models/sofa_korean.onnx"
 
+# ----------------------------------------------------------
+# Step 11: INT8 copy for CPU inference
+# ----------------------------------------------------------
+# The INT8 copy is dropped if its phoneme boundaries drift from the FP32
+# model on the reference clips; SOFAAligner loads it automatically on CPU.
+echo "[Step 11] Quantizing ONNX model for CPU..."
+if ! python "$SCRIPT_DIR/quantize_onnx.py" \
+    --input "$AI_WORKER_DIR/sofa/models/sofa_korean.onnx" \
+    --check-csv "$SOFA_REPO/data/full_label/transcriptions.csv"; then
+    echo "WARNING: INT8 model not produced (quantization or accuracy check failed)"
+fi
+
 echo "============================================"
 echo "Training complete!"
 echo "ONNX model: $AI_WORKER_DIR/sofa/models/sofa_korean.onnx"
+echo "INT8 model: $AI_WORKER_DIR/sofa/models/sofa_korean_int8.onnx (CPU)"
 echo "============================================"
 echo ""
 echo "To use: Set USE_SOFA_ALIGNER=true in your environment"
@@ -1,7 +1,9 @@
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
+# Containers inject env vars directly; KERO_SKIP_DOTENV=1 skips the .env probe
+if os.getenv("KERO_SKIP_DOTENV") != "1":
+    load_dotenv()
 
 RABBITMQ_HOST = os.getenv("RABBITMQ_HOST", "localhost")
 RABBITMQ_PORT = int(os.getenv("RABBITMQ_PORT", "5672"))
@@ -23,7 +25,13 @@ BACKEND_API_URL = os.getenv("BACKEND_API_URL", "https://kero.ooo")
 LYRICS_API_URL = os.getenv("LYRICS_API_URL", "https://lyrics.lewdhutao.my.eu.org")
 
 TEMP_DIR = os.getenv("TEMP_DIR", "/tmp/kero-ai")
-os.makedirs(TEMP_DIR, exist_ok=True)
+
+
+def get_temp_dir() -> str:
+    """Return TEMP_DIR, creating it if needed (kept out of import time)."""
+    os.makedirs(TEMP_DIR, exist_ok=True)
+    return TEMP_DIR
+
 
 QUEUE_NAMES = {
     "audio_process": "kero.audio.process",
@@ -33,3 +41,8 @@ QUEUE_NAMES = {
 
 # SOFA (Singing-Oriented Forced Aligner) settings
 SOFA_MODEL_PATH = os.getenv("SOFA_MODEL_PATH", "")
+# On CPU, load the <model>_int8.onnx sibling when it exists
+SOFA_USE_INT8 = os.getenv("SOFA_USE_INT8", "true").lower() == "true"
+
+# Separator: torch.compile the roformer forward (slow first song, faster after)
+SEPARATOR_TORCH_COMPILE = os.getenv("SEPARATOR_TORCH_COMPILE", "false").lower() == "true"
@@ -1,107 +1,105 @@
-import os
-import json
 import numpy as np
+import orjson
 import torch
 from torchfcpe import spawn_bundled_infer_model
-import librosa
+import soundfile as sf
+import torchaudio
 from typing import Dict, List, Callable, Optional
-from src.config import TEMP_DIR
 from src.services.s3_service import s3_service
+from src.utils.fcpe import FCPE_HOP, NOTE_NAMES, infer_f0_chunked
+
+# MIDI number -> note name ("A4" for 69), precomputed once at import
+_NOTE_TABLE = tuple(f"{NOTE_NAMES[m % 12]}{(m // 12) - 1}" for m in range(128))
+# Object array so a whole note-index column is gathered in one C-level take;
+# the trailing "" is the slot for unvoiced/out-of-range frames
+_NOTE_LOOKUP = np.array(_NOTE_TABLE + ("",), dtype=object)
 
 
 class FcpeProcessor:
     def __init__(self):
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self.chunk_duration = 60  # seconds - larger chunks since small model uses less VRAM
+        self.chunk_batch_size = 4  # chunks per forward pass (~4 minutes of audio)
+        # Loaded once per worker process and reused for every song
         self.model = spawn_bundled_infer_model(device=self.device)
+        self.model.eval()
 
     def analyze_pitch(self, audio_path: str, song_id: str, folder_name: str = None, progress_callback: Optional[Callable[[int], None]] = None) -> Dict:
         if folder_name is None:
             folder_name = song_id
             
-        audio, sr = librosa.load(audio_path, sr=16000, mono=True)
-        
-        # 청크 단위 처리로 CUDA OOM 방지
-        chunk_samples = self.chunk_duration * sr
-        total_chunks = max(1, (len(audio) + chunk_samples - 1) // chunk_samples)
-        
-        all_pitch = []
-        all_periodicity = []
-        
-        for i, start in enumerate(range(0, len(audio), chunk_samples)):
-            chunk = audio[start:start + chunk_samples]
-            # FCPE requires [batch, samples, 1] shape
-            audio_tensor = torch.from_numpy(chunk).float().unsqueeze(0).unsqueeze(-1).to(self.device)
-            
-            f0_chunk = self.model.infer(
-                audio_tensor,
-                sr=sr,
-                decoder_mode="local_argmax",
-                threshold=0.006,
-                f0_min=65,
-                f0_max=987.77,
-                interp_uv=False,
-            )
-            
-            f0_values = f0_chunk.squeeze().cpu().numpy()
-            # FCPE doesn't return confidence; synthesize from voicing
-            confidence_values = np.where(f0_values > 0, 1.0, 0.0).astype(np.float32)
-            
-            all_pitch.append(f0_values)
-            all_periodicity.append(confidence_values)
-            
-            # GPU 메모리 해제
-            del audio_tensor, f0_chunk
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-            
-            # 진행률 보고
-            if progress_callback:
-                progress_callback(int((i + 1) / total_chunks * 100))
+        sr = 16000
+        audio = self._load_audio(audio_path, sr)
         
+        # 청크 단위 처리로 CUDA OOM 방지 — 여러 청크를 하나의 배치로 묶어 추론
+        all_pitch = infer_f0_chunked(
+            self.model,
+            audio,
+            sr,
+            self.device,
+            chunk_duration=self.chunk_duration,
+            chunk_batch_size=self.chunk_batch_size,
+            progress_callback=progress_callback,
+        )
+
         # 결과 병합
         pitch = np.concatenate(all_pitch)
-        periodicity = np.concatenate(all_periodicity)
+        # FCPE doesn't return confidence; synthesize from voicing
+        periodicity = np.where(pitch > 0, 1.0, 0.0).astype(np.float32)
         
-        time = np.arange(len(pitch)) * 160 / sr
-
-        pitch_data = self._process_pitch_data(time, pitch, periodicity)
-
-        output_dir = os.path.join(TEMP_DIR, song_id)
-        os.makedirs(output_dir, exist_ok=True)
+        time = np.arange(len(pitch)) * FCPE_HOP / sr
 
-        pitch_path = os.path.join(output_dir, "pitch.json")
-        with open(pitch_path, "w", encoding="utf-8") as f:
-            json.dump(pitch_data, f, indent=2)
+        # Voiced-frame mask shared by the pitch points and the summary stats
+        valid_mask = (periodicity > 0.5) & ~np.isnan(pitch)
+        pitch_data = self._process_pitch_data(time, pitch, periodicity, valid_mask)
 
         s3_key = f"songs/{folder_name}/pitch.json"
-        pitch_url = s3_service.upload_file(pitch_path, s3_key)
-
-        os.remove(pitch_path)
-        os.rmdir(output_dir)
+        pitch_url = s3_service.upload_bytes(orjson.dumps(pitch_data), s3_key)
 
         return {
             "pitch_url": pitch_url,
             "pitch_data": pitch_data,
-            "stats": self._calculate_stats(pitch, periodicity),
+            "stats": self._calculate_stats(pitch[valid_mask]),
         }
 
+    def _load_audio(self, audio_path: str, target_sr: int) -> np.ndarray:
+        # soundfile decode + one polyphase resample pass (faster than librosa.load)
+        data, orig_sr = sf.read(audio_path, dtype="float32", always_2d=True)
+        audio = data.mean(axis=1) if data.shape[1] > 1 else data[:, 0]
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        if orig_sr != target_sr:
+            audio = torchaudio.functional.resample(
+                torch.from_numpy(audio), orig_sr, target_sr
+            ).numpy()
+        return audio
+
     def _process_pitch_data(
-        self, time: np.ndarray, frequency: np.ndarray, confidence: np.ndarray
-    ) -> List[Dict]:
-        pitch_points = []
-
-        for i in range(len(time)):
-            if confidence[i] > 0.5 and not np.isnan(frequency[i]):
-                pitch_points.append({
-                    "time": round(float(time[i]), 3),
-                    "frequency": round(float(frequency[i]), 2),
-                    "confidence": round(float(confidence[i]), 3),
-                    "note": self._frequency_to_note(frequency[i]),
-                    "midi": self._frequency_to_midi(frequency[i]),
-                })
-
-        return pitch_points
+        self,
+        time: np.ndarray,
+        frequency: np.ndarray,
+        confidence: np.ndarray,
+        valid_mask: np.ndarray,
+    ) -> Dict[str, List]:
+        """Voiced frames as parallel columns: time, frequency, confidence, note, midi."""
+        idx = np.nonzero(valid_mask)[0]
+
+        freq = frequency[idx].astype(np.float64)
+        voiced = freq > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            midi_arr = np.where(
+                voiced, np.rint(69 + 12 * np.log2(freq / 440.0)), 0
+            ).astype(np.int64)
+
+        # Unvoiced/out-of-range frames point at the trailing "" entry
+        note_idx = np.where(voiced & (midi_arr >= 0) & (midi_arr < 128), midi_arr, 128)
+
+        return {
+            "time": np.round(time[idx].astype(np.float64), 3).tolist(),
+            "frequency": np.round(freq, 2).tolist(),
+            "confidence": np.round(confidence[idx].astype(np.float64), 3).tolist(),
+            "note": _NOTE_LOOKUP[note_idx].tolist(),
+            "midi": midi_arr.tolist(),
+        }
 
     def _frequency_to_midi(self, frequency: float) -> int:
         if frequency <= 0 or np.isnan(frequency):
@@ -111,22 +109,16 @@ class FcpeProcessor:
     def _frequency_to_note(self, frequency: float) -> str:
         if frequency <= 0 or np.isnan(frequency):
             return ""
-        notes = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
         midi = self._frequency_to_midi(frequency)
-        note_index = midi % 12
-        octave = (midi // 12) - 1
-        return f"{notes[note_index]}{octave}"
-
-    def _calculate_stats(self, frequency: np.ndarray, confidence: np.ndarray) -> Dict:
-        valid_mask = (confidence > 0.5) & ~np.isnan(frequency)
-        valid_frequencies = frequency[valid_mask]
+        return _NOTE_TABLE[midi] if 0 <= midi < 128 else ""
 
+    def _calculate_stats(self, valid_frequencies: np.ndarray) -> Dict:
         if len(valid_frequencies) == 0:
             return {"min_freq": 0, "max_freq": 0, "avg_freq": 0, "range_semitones": 0}
 
-        min_freq = float(np.min(valid_frequencies))
-        max_freq = float(np.max(valid_frequencies))
-        avg_freq = float(np.mean(valid_frequencies))
+        min_freq = float(valid_frequencies.min())
+        max_freq = float(valid_frequencies.max())
+        avg_freq = float(valid_frequencies.mean())
 
         range_semitones = 12 * np.log2(max_freq / min_freq) if min_freq > 0 else 0
 
@@ -1,5 +1,6 @@
 import re
 import gc
+import functools
 import torch
 import unicodedata
 
@@ -7,15 +8,135 @@ import numpy as np
 import librosa
 from torchfcpe import spawn_bundled_infer_model
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import soundfile as sf
 
-from typing import List, Dict, Callable, Optional
-from src.config import LYRICS_API_URL, SOFA_MODEL_PATH
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import List, Dict, Callable, Optional, Tuple
+from src.config import LYRICS_API_URL, SOFA_MODEL_PATH, SOFA_USE_INT8
+from src.utils.fcpe import FCPE_HOP, NOTE_NAMES, infer_f0_chunked
+
+# Compiled once at import; _clean_lyrics / _detect_language run per song
+_YOUTUBE_PATTERNS = [
+    r'자막|제공|배달의민족|한글자막|시청해주셔서|감사합니다',
+    r'광고를.*포함|유료.*광고|PPL',
+    r'字幕|提供|感谢观看|订阅|点赞',
+    r'字幕|提供|ご視聴|チャンネル登録',
+    r'subscribe|like.*comment|thanks.*watching',
+    r'다음.*영상|next.*video',
+    r'MV|뮤직비디오|music\s*video',
+]
+_YOUTUBE_RE = re.compile('|'.join(_YOUTUBE_PATTERNS), re.IGNORECASE)
+_KOREAN_RE = re.compile(r'[\uac00-\ud7af]')
+_BRACKET_RE = re.compile(r'\[.*?\]')
+_PAREN_RE = re.compile(r'\(.*?\)')
+_REPEAT_RE = re.compile(r'(.)\1{4,}')
+_WS_RE = re.compile(r'\s+')
+_SYMBOL_ONLY_RE = re.compile(r'^[♪~\s\.\,]+$')
+
+
+@functools.cache
+def _whitespace_cps() -> np.ndarray:
+    """BMP code points matched by regex \\s (== str.isspace), for _detect_language.
+
+    Built on first use; astral code points are checked with str.isspace there.
+    """
+    return np.array([cp for cp in range(0x10000) if chr(cp).isspace()], dtype=np.uint32)
+
+
+class _StripTable(dict):
+    """str.translate table for _strip_for_match, filled in as characters are seen.
+
+    Whitespace, punctuation (P*) and symbols (S*, incl. astral emoji) map to
+    None; everything else maps to itself. Avoids classifying all 0x110000
+    code points up front.
+    """
+
+    def __missing__(self, cp: int):
+        ch = chr(cp)
+        value = None if ch.isspace() or unicodedata.category(ch)[0] in "PS" else cp
+        self[cp] = value
+        return value
+
+
+_STRIP_TABLE = _StripTable()
+
+
+# Shared session: keeps the TLS connection to the lyrics API alive across songs
+_HTTP = requests.Session()
+_HTTP.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.3)),
+)
+
+_fcpe_model = None
+
+
+def _get_fcpe_model(device: str):
+    """Lazy-load the FCPE model once per worker process (shared by every song)."""
+    global _fcpe_model
+    if _fcpe_model is None:
+        _fcpe_model = spawn_bundled_infer_model(device=device)
+        _fcpe_model.eval()
+    return _fcpe_model
+
+
+_sofa_aligner = None
+
+
+def _get_sofa_aligner(device: str):
+    """Lazy-load the SOFA aligner once per worker process.
+
+    Keeps the ONNX session, G2P and vocab across songs instead of paying
+    the session load for every job.
+    """
+    global _sofa_aligner
+    if _sofa_aligner is None:
+        from src.processors.sofa_aligner import SOFAAligner
+
+        _sofa_aligner = SOFAAligner(
+            model_path=SOFA_MODEL_PATH or None,
+            device=device,
+            quantized=SOFA_USE_INT8,
+        )
+    return _sofa_aligner
+
+
+def _frame_rms(y: np.ndarray, frame_length: int = 2048, hop_length: int = 512) -> np.ndarray:
+    """Same frames as librosa.feature.rms(center=True, zero padding), built from
+    per-hop block energies instead of a 4x-overlapping framed copy.
+
+    Requires frame_length // 2 to be a multiple of hop_length.
+    """
+    pad = frame_length // 2
+    n_frames = 1 + (len(y) + 2 * pad - frame_length) // hop_length
+    blocks_per_frame = frame_length // hop_length
+    lead = pad // hop_length
+
+    n_blocks = -(-len(y) // hop_length)
+    sq = np.zeros(n_blocks * hop_length, dtype=np.float32)
+    np.square(y, out=sq[:len(y)])
+    block = sq.reshape(n_blocks, hop_length).sum(axis=1, dtype=np.float64)
+
+    # Prefix sums over [lead zero blocks] + blocks + [trailing zero blocks]
+    csum = np.zeros(lead + n_blocks + blocks_per_frame + 1)
+    np.cumsum(block, out=csum[lead + 1:lead + 1 + n_blocks])
+    csum[lead + 1 + n_blocks:] = csum[lead + n_blocks]
+
+    t = np.arange(n_frames)
+    power = (csum[t + blocks_per_frame] - csum[t]) / frame_length
+    return np.sqrt(np.maximum(power, 0.0)).astype(np.float32)
 
 
 class LyricsProcessor:
     def __init__(self):
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        # Runs FCPE alongside the CPU-side refine/energy stages
+        self._pitch_executor = ThreadPoolExecutor(max_workers=1)
+        if self.device == "cuda":
+            # FCPE sees fixed 60s chunks; let cuDNN pick the fastest kernels
+            torch.backends.cudnn.benchmark = True
 
     def _fetch_lyrics_from_api(self, title: Optional[str], artist: Optional[str]) -> Optional[str]:
         if not title:
@@ -29,14 +150,17 @@ class LyricsProcessor:
             url = f"{LYRICS_API_URL}/v2/youtube/lyrics"
             print(f"[Lyrics API] Fetching: {url} params={params}")
 
-            response = requests.get(url, params=params, timeout=15)
+            response = _HTTP.get(url, params=params, timeout=(3.05, 15))
 
             if response.status_code == 200:
                 data = response.json()
                 lyrics_text = data.get("data", {}).get("lyrics")
                 # "respone" is the API's actual typo for 404 responses
                 if lyrics_text and not data.get("data", {}).get("respone"):
-                    lyrics_text = lyrics_text.replace("\r\n", "\n").replace("\r", "\n")
+                    if "\r" in lyrics_text:
+                        # str.replace returns the same object when nothing matches,
+                        # so only real CRLF/CR text is copied (faster than re.sub)
+                        lyrics_text = lyrics_text.replace("\r\n", "\n").replace("\r", "\n")
                     print(f"[Lyrics API] Got lyrics: {len(lyrics_text)} chars, track={data['data'].get('trackName')}")
                     return lyrics_text
                 else:
@@ -56,16 +180,20 @@ class LyricsProcessor:
             return language
 
         # Check metadata for Korean
-        korean_pattern = re.compile(r'[\uac00-\ud7af]')
-        if title and korean_pattern.search(title):
+        if title and _KOREAN_RE.search(title):
             return "ko"
-        if artist and korean_pattern.search(artist):
+        if artist and _KOREAN_RE.search(artist):
             return "ko"
 
-        # Check text content
-        korean_chars = len(re.findall(r'[\uac00-\ud7af]', text))
-        japanese_chars = len(re.findall(r'[\u3040-\u30ff]', text))
-        total_chars = len(re.sub(r'\s', '', text))
+        # Check text content: one UTF-32 view, counted with vectorized range masks.
+        # surrogatepass keeps lone surrogates (bad \ud8xx escapes in API text)
+        # as one code point each instead of raising
+        codepoints = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        korean_chars = np.count_nonzero((codepoints >= 0xAC00) & (codepoints <= 0xD7AF))
+        japanese_chars = np.count_nonzero((codepoints >= 0x3040) & (codepoints <= 0x30FF))
+        whitespace = np.count_nonzero(np.isin(codepoints, _whitespace_cps()))
+        whitespace += sum(chr(cp).isspace() for cp in codepoints[codepoints >= 0x10000].tolist())
+        total_chars = codepoints.size - whitespace
 
         if total_chars > 0:
             if korean_chars / total_chars > 0.2:
@@ -78,32 +206,21 @@ class LyricsProcessor:
     def _clean_lyrics(self, segments: List[Dict], language: str = "en") -> List[Dict]:
         cleaned = []
         
-        youtube_patterns = [
-            r'자막|제공|배달의민족|한글자막|시청해주셔서|감사합니다',
-            r'광고를.*포함|유료.*광고|PPL',
-            r'字幕|提供|感谢观看|订阅|点赞',
-            r'字幕|提供|ご視聴|チャンネル登録',
-            r'subscribe|like.*comment|thanks.*watching',
-            r'다음.*영상|next.*video',
-            r'MV|뮤직비디오|music\s*video',
-        ]
-        youtube_regex = re.compile('|'.join(youtube_patterns), re.IGNORECASE)
-        
         for segment in segments:
             text = segment["text"]
             
-            text = re.sub(r'\[.*?\]', '', text)
-            text = re.sub(r'\(.*?\)', '', text)
-            text = re.sub(r'(.)\1{4,}', r'\1\1\1', text)
-            text = re.sub(r'\s+', ' ', text).strip()
+            text = _BRACKET_RE.sub('', text)
+            text = _PAREN_RE.sub('', text)
+            text = _REPEAT_RE.sub(r'\1\1\1', text)
+            text = _WS_RE.sub(' ', text).strip()
             
             if not text or len(text) < 2:
                 continue
             
-            if re.match(r'^[♪~\s\.\,]+$', text):
+            if _SYMBOL_ONLY_RE.match(text):
                 continue
             
-            if youtube_regex.search(text):
+            if _YOUTUBE_RE.search(text):
                 print(f"[Clean] Filtered YouTube pattern: {text[:50]}")
                 continue
                 
@@ -111,78 +228,94 @@ class LyricsProcessor:
             
             if segment.get("words"):
                 cleaned_words = []
+                cleaned_texts = []
                 for word in segment["words"]:
                     word_text = word["text"].strip()
                     if word_text and len(word_text) >= 1:
                         word["text"] = word_text
                         cleaned_words.append(word)
+                        cleaned_texts.append(word_text)
                 segment["words"] = cleaned_words
                 
                 if cleaned_words:
-                    segment["text"] = " ".join(w["text"] for w in cleaned_words).strip()
+                    # Word texts are already stripped and non-empty
+                    segment["text"] = " ".join(cleaned_texts)
             
             if segment.get("text") and len(segment["text"]) >= 2:
                 cleaned.append(segment)
         
         return cleaned
 
-    def _add_energy_to_words(self, vocals_path: str, segments: List[Dict]) -> List[Dict]:
+    def _add_energy_to_words(self, y: np.ndarray, sr: int, segments: List[Dict]) -> List[Dict]:
         """Add RMS energy values (0.0-1.0) to each word based on vocal intensity"""
         try:
-            print(f"[Energy] Loading vocals from {vocals_path}...")
-            y, sr = librosa.load(vocals_path, sr=16000)
-            
             # Calculate RMS energy with small hop length for precision
-            rms = librosa.feature.rms(y=y, frame_length=2048, hop_length=512)[0]
-            times = librosa.times_like(rms, sr=sr, hop_length=512)
+            rms = _frame_rms(y, frame_length=2048, hop_length=512)
+            times = np.arange(len(rms)) * (512 / sr)
             
             # Windowed normalization to preserve local dynamics
             window_size_frames = int(30 * sr / 512)
             window_size_frames = max(window_size_frames, 1)
-            
-            total_words = 0
-            energy_added = 0
-            
-            for segment in segments:
-                words = segment.get("words", [])
-                for word in words:
-                    total_words += 1
-                    start_time = word.get("start_time", 0)
-                    end_time = word.get("end_time", 0)
-                    
-                    start_idx = np.searchsorted(times, start_time)
-                    end_idx = np.searchsorted(times, end_time)
-                    
-                    if start_idx < end_idx and end_idx <= len(rms):
-                        center = (start_idx + end_idx) // 2
-                        win_start = max(0, center - window_size_frames // 2)
-                        win_end = min(len(rms), center + window_size_frames // 2)
-                        local_rms = rms[win_start:win_end]
-                        local_min = float(local_rms.min()) if len(local_rms) else 0.0
-                        local_max = float(local_rms.max()) if len(local_rms) else 1.0
-                        local_range = local_max - local_min + 1e-8
-
-                        word_rms_slice = rms[start_idx:end_idx]
-                        word_rms = float(word_rms_slice.mean())
-                        # Normalize to 0-1 within local window
-                        energy = (word_rms - local_min) / local_range
-                        word["energy"] = round(float(energy), 3)
-
-                        # Energy contour (4-8 samples) across the word duration
-                        if len(word_rms_slice) > 1:
-                            n_points = min(6, len(word_rms_slice))
-                            indices = np.linspace(0, len(word_rms_slice) - 1, n_points, dtype=int)
-                            curve = word_rms_slice[indices]
-                            curve_normalized = (curve - local_min) / local_range
-                            word["energy_curve"] = [round(float(v), 3) for v in curve_normalized]
-                        else:
-                            word["energy_curve"] = [round(float(energy), 3)]
+            half_window = window_size_frames // 2
+
+            words = [word for segment in segments for word in segment.get("words", [])]
+            total_words = len(words)
+
+            # Frame ranges for every word at once
+            start_idx = np.searchsorted(times, [w.get("start_time", 0) for w in words])
+            end_idx = np.searchsorted(times, [w.get("end_time", 0) for w in words])
+            valid = (start_idx < end_idx) & (end_idx <= len(rms))
+            starts = start_idx[valid]
+            ends = end_idx[valid]
+            lengths = ends - starts
+
+            # Local min/max over the ±15s window around each word center. Edge
+            # padding reproduces the clipped window exactly for min/max.
+            centers = (starts + ends) // 2
+            padded = np.pad(rms, half_window, mode="edge")
+            windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * half_window)[centers]
+            local_min = windows.min(axis=1).astype(np.float64)
+            local_max = windows.max(axis=1).astype(np.float64)
+            local_range = local_max - local_min + 1e-8
+
+            # Word means from prefix sums
+            csum = np.concatenate(([0.0], np.cumsum(rms, dtype=np.float64)))
+            word_rms = (csum[ends] - csum[starts]) / np.maximum(lengths, 1)
+            # Normalize to 0-1 within local window
+            energies = (word_rms - local_min) / local_range
+
+            # Energy contour (up to 6 samples) across the word duration; same
+            # points as np.linspace(0, len - 1, n, dtype=int)
+            n_points = np.minimum(6, lengths)
+            k = np.arange(6)
+            offsets = (k * (lengths[:, None] - 1)) // np.maximum(n_points[:, None] - 1, 1)
+            curve_idx = np.minimum(starts[:, None] + offsets, len(rms) - 1)
+            # rms is float32, so the contour math stays float32 (as the old
+            # per-word float32 slice minus a Python float did)
+            curves = rms[curve_idx] - local_min[:, None].astype(np.float32)
+            curves /= local_range[:, None].astype(np.float32)
+
+            # Round once per array instead of per element. energies are already
+            # float64; the float32 curves are widened first so np.round matches
+            # round(float(v), 3)
+            energies = np.round(energies, 3).tolist()
+            curves = np.round(curves.astype(np.float64), 3).tolist()
+            n_points = n_points.tolist()
 
-                        energy_added += 1
+            energy_added = 0
+            for word, is_valid in zip(words, valid.tolist()):
+                if is_valid:
+                    energy = energies[energy_added]
+                    word["energy"] = energy
+                    if n_points[energy_added] > 1:
+                        word["energy_curve"] = curves[energy_added][:n_points[energy_added]]
                     else:
-                        # Default for very short words or edge cases
-                        word["energy"] = 0.5
-                        word["energy_curve"] = [0.5]
+                        word["energy_curve"] = [energy]
+                    energy_added += 1
+                else:
+                    # Default for very short words or edge cases
+                    word["energy"] = 0.5
+                    word["energy_curve"] = [0.5]
             
             print(f"[Energy] Added energy values to {energy_added}/{total_words} words")
             return segments
@@ -196,96 +329,77 @@ class LyricsProcessor:
                     word["energy_curve"] = [0.5]
             return segments
 
-    def _add_pitch_to_words(self, vocals_path: str, segments: List[Dict]) -> List[Dict]:
+    def _compute_pitch_track(self, audio: np.ndarray, sr: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Run FCPE over the vocals; returns (time, pitch, periodicity) at 20ms frames."""
+        if audio.size == 0:
+            empty = np.zeros(0, dtype=np.float32)
+            return empty.astype(np.float64), empty, empty
+        # 60s chunks, 4 per forward pass, to keep CUDA memory bounded
+        all_pitch = infer_f0_chunked(_get_fcpe_model(self.device), audio, sr, self.device)
+
+        # Downsample from 10ms (FCPE default) to 20ms to match original hop_length=320
+        pitch = np.concatenate([f0_values[::2] for f0_values in all_pitch])
+        # FCPE doesn't return confidence; synthesize from voicing
+        periodicity = np.where(pitch > 0, 1.0, 0.0).astype(np.float32)
+        time = np.arange(len(pitch)) * (2 * FCPE_HOP) / sr  # 20ms per frame (matches hop_length)
+        return time, pitch, periodicity
+
+    def _add_pitch_to_words(
+        self,
+        audio: np.ndarray,
+        sr: int,
+        segments: List[Dict],
+        pitch_future: Optional[Future] = None,
+    ) -> List[Dict]:
         """Add pitch data (frequency, note, midi) to each word based on vocal analysis"""
         try:
-            print(f"[Pitch] Loading vocals from {vocals_path}...")
-            audio, sr = librosa.load(vocals_path, sr=16000, mono=True)
-            
-            # Process in chunks to avoid CUDA OOM
-            chunk_duration = 60  # Larger chunks since tiny model uses less VRAM
-            chunk_samples = chunk_duration * sr
-            
-            all_pitch = []
-            all_periodicity = []
-            
-            # Lazy-load FCPE model
-            if not hasattr(self, '_fcpe_model'):
-                self._fcpe_model = spawn_bundled_infer_model(device=self.device)
-            
-            for start in range(0, len(audio), chunk_samples):
-                chunk = audio[start:start + chunk_samples]
-                # FCPE requires [batch, samples, 1] shape
-                audio_tensor = torch.from_numpy(chunk).float().unsqueeze(0).unsqueeze(-1).to(self.device)
-                
-                f0_chunk = self._fcpe_model.infer(
-                    audio_tensor,
-                    sr=sr,
-                    decoder_mode="local_argmax",
-                    threshold=0.006,
-                    f0_min=65,
-                    f0_max=987.77,
-                    interp_uv=False,
-                )
-                
-                f0_values = f0_chunk.squeeze().cpu().numpy()
-                # FCPE doesn't return confidence; synthesize from voicing
-                confidence_values = np.where(f0_values > 0, 1.0, 0.0).astype(np.float32)
-                
-                # Downsample from 10ms (FCPE default) to 20ms to match original hop_length=320
-                all_pitch.append(f0_values[::2])
-                all_periodicity.append(confidence_values[::2])
-                
-                del audio_tensor, f0_chunk
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-            
-            pitch = np.concatenate(all_pitch)
-            periodicity = np.concatenate(all_periodicity)
-            time = np.arange(len(pitch)) * 320 / sr  # 20ms per frame (matches hop_length)
-            
-             # Helper functions (same as fcpe_processor.py, now using FCPE)
-            def freq_to_midi(freq):
-                if freq <= 0 or np.isnan(freq):
-                    return 0
-                return int(round(69 + 12 * np.log2(freq / 440.0)))
-            
-            def freq_to_note(freq):
-                if freq <= 0 or np.isnan(freq):
-                    return ""
-                notes = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-                midi = freq_to_midi(freq)
-                return f"{notes[midi % 12]}{(midi // 12) - 1}"
+            if pitch_future is not None:
+                # FCPE already started in the background (see extract_lyrics)
+                time, pitch, periodicity = pitch_future.result()
+            else:
+                time, pitch, periodicity = self._compute_pitch_track(audio, sr)
             
-            total_words = 0
+            words = [word for segment in segments for word in segment.get("words", [])]
+            total_words = len(words)
             pitch_added = 0
+
+            # Frame ranges for every word in one searchsorted call per bound
+            word_starts = np.searchsorted(time, [w.get("start_time", 0) for w in words])
+            word_ends = np.searchsorted(time, [w.get("end_time", 0) for w in words])
+
+            # Only consider frames with good periodicity (voice detected); prefix
+            # sums over those frames give every word's mean in O(1)
+            voiced = (periodicity > 0.5) & ~np.isnan(pitch)
+            voiced_sum = np.concatenate(([0.0], np.cumsum(np.where(voiced, pitch, 0.0), dtype=np.float64)))
+            voiced_count = np.concatenate(([0], np.cumsum(voiced)))
+
+            in_range = (word_starts < word_ends) & (word_ends <= len(pitch))
+            start_c = np.minimum(word_starts, len(pitch))
+            end_c = np.minimum(word_ends, len(pitch))
+            n_voiced = np.where(in_range, voiced_count[end_c] - voiced_count[start_c], 0)
+            has_pitch = n_voiced > 0
+            avg_freqs = np.where(
+                has_pitch, (voiced_sum[end_c] - voiced_sum[start_c]) / np.maximum(n_voiced, 1), 0.0
+            )
+
+            # Frequency -> MIDI for all voiced words at once (same math as fcpe_processor.py)
+            midis = np.zeros(len(words), dtype=np.int64)
+            midis[has_pitch] = np.rint(69 + 12 * np.log2(avg_freqs[has_pitch] / 440.0))
             
-            for segment in segments:
-                for word in segment.get("words", []):
-                    total_words += 1
-                    start_time = word.get("start_time", 0)
-                    end_time = word.get("end_time", 0)
-                    
-                    start_idx = np.searchsorted(time, start_time)
-                    end_idx = np.searchsorted(time, end_time)
-                    
-                    if start_idx < end_idx and end_idx <= len(pitch):
-                        # Only consider frames with good periodicity (voice detected)
-                        mask = periodicity[start_idx:end_idx] > 0.5
-                        valid_freqs = pitch[start_idx:end_idx][mask]
-                        
-                        if len(valid_freqs) > 0 and not np.all(np.isnan(valid_freqs)):
-                            avg_freq = float(np.nanmean(valid_freqs))
-                            word["pitch"] = round(avg_freq, 2)
-                            word["note"] = freq_to_note(avg_freq)
-                            word["midi"] = freq_to_midi(avg_freq)
-                            pitch_added += 1
-                            continue
-                    
-                    # Default values for words where pitch can't be determined
-                    word["pitch"] = 0
-                    word["note"] = ""
-                    word["midi"] = 0
+            for word, voiced_word, avg_freq, midi in zip(
+                words, has_pitch.tolist(), avg_freqs.tolist(), midis.tolist()
+            ):
+                if voiced_word:
+                    word["pitch"] = round(avg_freq, 2)
+                    word["note"] = f"{NOTE_NAMES[midi % 12]}{(midi // 12) - 1}"
+                    word["midi"] = midi
+                    pitch_added += 1
+                    continue
+                
+                # Default values for words where pitch can't be determined
+                word["pitch"] = 0
+                word["note"] = ""
+                word["midi"] = 0
             
             print(f"[Pitch] Added pitch values to {pitch_added}/{total_words} words")
             return segments
@@ -303,16 +417,7 @@ class LyricsProcessor:
         return "\uac00" <= char <= "\ud7a3"
 
     def _strip_for_match(self, text: str) -> str:
-        normalized = unicodedata.normalize("NFKC", text or "")
-        stripped = []
-        for char in normalized:
-            if char.isspace():
-                continue
-            category = unicodedata.category(char)
-            if category.startswith("P") or category.startswith("S"):
-                continue
-            stripped.append(char)
-        return "".join(stripped)
+        return unicodedata.normalize("NFKC", text or "").translate(_STRIP_TABLE)
 
     def _extract_syllables(self, text: str) -> List[str]:
         stripped = self._strip_for_match(text)
@@ -325,7 +430,9 @@ class LyricsProcessor:
         return syllables
 
     def _count_chars(self, text: str) -> int:
-        return len(self._extract_syllables(text))
+        # == len(self._extract_syllables(text)): Hangul syllables are alphanumeric,
+        # and whitespace/P*/S* never are, so no stripped string or list is needed
+        return sum(map(str.isalnum, unicodedata.normalize("NFKC", text or "")))
 
     def _build_word_timings(self, line_text: str, line_start: float, line_end: float) -> List[Dict]:
         words = line_text.split()
@@ -391,64 +498,79 @@ class LyricsProcessor:
         if len(window) < hop * (consecutive_required + 2):
             return None
 
-        # Fine-grained RMS
+        # Fine-grained RMS over a (n_frames, hop) view of the window
         n_frames = len(window) // hop
-        rms = np.array([
-            np.sqrt(np.mean(window[i * hop:(i + 1) * hop] ** 2))
-            for i in range(n_frames)
-        ])
+        frames = window[:n_frames * hop].reshape(n_frames, hop)
+        rms = np.sqrt(np.einsum('ij,ij->i', frames, frames) / hop)
 
         if len(rms) < consecutive_required + 1:
             return None
 
         # Threshold: 10% of the singing level in this window
-        rms_sorted = np.sort(rms)
-        top50_start = max(1, int(0.50 * len(rms_sorted)))
-        singing_level = float(np.median(rms_sorted[top50_start:]))
+        top50_start = max(1, int(0.50 * n_frames))
+        singing_level = float(np.median(np.partition(rms, top50_start)[top50_start:]))
         threshold = singing_level * 0.10
 
         if threshold <= 0:
             return None
 
-        # Find first sustained energy rise
-        consecutive = 0
-        for i in range(n_frames):
-            if rms[i] > threshold:
-                consecutive += 1
-                if consecutive >= consecutive_required:
-                    onset_frame = i - consecutive_required + 1
-                    onset_sec = search_start + (onset_frame * hop / sr)
-                    return round(onset_sec, 3)
-            else:
-                consecutive = 0
+        # Find first sustained energy rise: run length of above-threshold
+        # frames = running count minus the count at the last frame below it
+        above = rms > threshold
+        count = np.cumsum(above)
+        runs = count - np.maximum.accumulate(np.where(above, 0, count))
+        hits = np.flatnonzero(runs >= consecutive_required)
+        if not len(hits):
+            return None
 
-        return None
+        onset_frame = int(hits[0]) - consecutive_required + 1
+        onset_sec = search_start + (onset_frame * hop / sr)
+        return round(onset_sec, 3)
 
-    def _refine_with_energy_onsets(self, segments: List[Dict], vocals_path: str) -> List[Dict]:
+    def _refine_with_energy_onsets(self, segments: List[Dict], y: np.ndarray, sr: int) -> List[Dict]:
         """Post-process: snap word start times to actual vocal energy onsets."""
         try:
-            print(f"[Refine] Loading vocals for energy onset detection...")
-            y, sr = librosa.load(vocals_path, sr=16000)
-
-            # Compute onset times using librosa (for general words)
-            onset_env = librosa.onset.onset_strength(y=y, sr=sr, hop_length=256)
+            # Compute onset times using librosa (for general words). hop 512
+            # (32 ms at 16 kHz) halves the STFT frames and stays well inside
+            # the ±150 ms snap tolerance
+            onset_hop = 512
+            onset_env = librosa.onset.onset_strength(y=y, sr=sr, hop_length=onset_hop)
             onset_frames = librosa.onset.onset_detect(
-                onset_envelope=onset_env, sr=sr, hop_length=256,
+                onset_envelope=onset_env, sr=sr, hop_length=onset_hop,
                 backtrack=True, units='frames'
             )
-            onset_times = librosa.frames_to_time(onset_frames, sr=sr, hop_length=256)
+            # Same values as librosa.frames_to_time, without its samples round trip
+            onset_times = onset_frames * onset_hop / sr
 
             tolerance = 0.15  # ±150ms snap window for most words
             first_line_tolerance = 0.5  # ±500ms for the first word of the first line
             total_snapped = 0
             total_words = 0
 
+            # Nearest onset for every word start at once: onset_times is sorted,
+            # so the closest onset is one of the two around the insertion point
+            # (ties go left, as argmin would)
+            word_starts = np.array(
+                [w["start_time"] for segment in segments for w in segment.get("words", [])],
+                dtype=np.float64,
+            )
+            if len(onset_times) > 0:
+                ins = np.searchsorted(onset_times, word_starts)
+                left = onset_times[np.clip(ins - 1, 0, len(onset_times) - 1)]
+                right = onset_times[np.clip(ins, 0, len(onset_times) - 1)]
+                left_diff = np.abs(left - word_starts)
+                right_diff = np.abs(right - word_starts)
+                use_left = left_diff <= right_diff
+                nearest_onsets = np.where(use_left, left, right).tolist()
+                nearest_diffs = np.where(use_left, left_diff, right_diff).tolist()
+
             for seg_idx, segment in enumerate(segments):
                 words = segment.get("words", [])
                 line_start = segment["start_time"]
                 line_end = segment["end_time"]
 
                 for i, word in enumerate(words):
+                    word_pos = total_words
                     total_words += 1
                     start = word["start_time"]
 
@@ -474,10 +596,8 @@ class LyricsProcessor:
                         else:
                             # Fall back to librosa onset_detect
                             if len(onset_times) > 0:
-                                diffs = np.abs(onset_times - start)
-                                min_idx = np.argmin(diffs)
-                                if diffs[min_idx] <= first_line_tolerance:
-                                    new_start = float(onset_times[min_idx])
+                                if nearest_diffs[word_pos] <= first_line_tolerance:
+                                    new_start = nearest_onsets[word_pos]
                                     floor = max(0.0, start - first_line_tolerance)
                                     if new_start >= floor:
                                         word["start_time"] = round(new_start, 3)
@@ -490,10 +610,8 @@ class LyricsProcessor:
                     else:
                         # --- Standard onset snap for other words ---
                         if len(onset_times) > 0:
-                            diffs = np.abs(onset_times - start)
-                            min_idx = np.argmin(diffs)
-                            if diffs[min_idx] <= tolerance:
-                                new_start = float(onset_times[min_idx])
+                            if nearest_diffs[word_pos] <= tolerance:
+                                new_start = nearest_onsets[word_pos]
                                 prev_end = words[i - 1]["end_time"] if i > 0 else line_start
                                 if new_start >= prev_end:
                                     word["start_time"] = round(new_start, 3)
@@ -620,10 +738,10 @@ class LyricsProcessor:
                 # Redistribute words within the new boundaries
                 if words:
                     line_dur = max(line_end - line_start, 0.1)
-                    total_chars = sum(max(1, self._count_chars(w["text"])) for w in words)
+                    char_counts = [max(1, self._count_chars(w["text"])) for w in words]
+                    total_chars = sum(char_counts)
                     current = line_start
-                    for w in words:
-                        chars = max(1, self._count_chars(w["text"]))
+                    for w, chars in zip(words, char_counts):
                         w_dur = line_dur * (chars / total_chars)
                         w["start_time"] = round(current, 3)
                         w["end_time"] = round(current + w_dur, 3)
@@ -698,15 +816,8 @@ class LyricsProcessor:
 
         lyrics_lines = []
         try:
-            from src.processors.sofa_aligner import SOFAAligner
-
-            sofa = SOFAAligner(
-                model_path=SOFA_MODEL_PATH or None,
-                device=self.device,
-            )
-
+            sofa = _get_sofa_aligner(self.device)
             all_words = sofa.align_words(audio_path, lyrics_text, language=detected_language)
-            sofa.release_model()
 
             print(f"[SOFA] Aligned {len(all_words)} words from full audio")
 
@@ -745,41 +856,62 @@ class LyricsProcessor:
         lyrics_lines = self._clean_lyrics(lyrics_lines, detected_language)
         print(f"[Clean] {len(lyrics_lines)} lines after cleaning")
 
-        # ==============================================================
-        # Stage 3: Energy onset refinement (snap word starts to audio)
-        # ==============================================================
-        print("=" * 60)
-        print("[Stage 3: Refine] Snapping word times to energy onsets...")
-        print("=" * 60)
-
-        lyrics_lines = self._refine_with_energy_onsets(lyrics_lines, audio_path)
-
-        # ==============================================================
-        # Stage 4: Enforce monotonic line boundaries (no overlaps)
-        # ==============================================================
-        print("=" * 60)
-        print("[Stage 4: Monotonic] Enforcing non-overlapping line boundaries...")
-        print("=" * 60)
-
-        lyrics_lines = self._enforce_monotonic_lines(lyrics_lines)
-
-        # ==============================================================
-        # Stage 5: Energy analysis
-        # ==============================================================
-        print("=" * 60)
-        print("[Stage 5: Energy] Analyzing vocal intensity...")
-        print("=" * 60)
-
-        lyrics_lines = self._add_energy_to_words(audio_path, lyrics_lines)
+        # Decode + resample the vocals once for the refine/energy/pitch stages
+        print(f"[Audio] Loading vocals from {audio_path}...")
+        try:
+            y, sr = librosa.load(audio_path, sr=16000, mono=True)
+        except Exception as e:
+            # Empty signal: every stage below falls back to its defaults
+            print(f"[Audio] Failed to load vocals: {e}")
+            y, sr = np.zeros(0, dtype=np.float32), 16000
 
-        # ==============================================================
-        # Stage 6: Pitch analysis
-        # ==============================================================
-        print("=" * 60)
-        print("[Stage 6: Pitch] Analyzing vocal melody...")
-        print("=" * 60)
+        # Pitch frames depend only on the audio: start FCPE now so it overlaps
+        # Stages 3-5, and map it onto the finalized word times in Stage 6
+        pitch_future = None
+        if y.size:
+            pitch_future = self._pitch_executor.submit(self._compute_pitch_track, y, sr)
 
-        lyrics_lines = self._add_pitch_to_words(audio_path, lyrics_lines)
+        try:
+            # ==============================================================
+            # Stage 3: Energy onset refinement (snap word starts to audio)
+            # ==============================================================
+            print("=" * 60)
+            print("[Stage 3: Refine] Snapping word times to energy onsets...")
+            print("=" * 60)
+
+            lyrics_lines = self._refine_with_energy_onsets(lyrics_lines, y, sr)
+
+            # ==============================================================
+            # Stage 4: Enforce monotonic line boundaries (no overlaps)
+            # ==============================================================
+            print("=" * 60)
+            print("[Stage 4: Monotonic] Enforcing non-overlapping line boundaries...")
+            print("=" * 60)
+
+            lyrics_lines = self._enforce_monotonic_lines(lyrics_lines)
+
+            # ==============================================================
+            # Stage 5: Energy analysis
+            # ==============================================================
+            print("=" * 60)
+            print("[Stage 5: Energy] Analyzing vocal intensity...")
+            print("=" * 60)
+
+            lyrics_lines = self._add_energy_to_words(y, sr, lyrics_lines)
+
+            # ==============================================================
+            # Stage 6: Pitch analysis
+            # ==============================================================
+            print("=" * 60)
+            print("[Stage 6: Pitch] Analyzing vocal melody...")
+            print("=" * 60)
+
+            lyrics_lines = self._add_pitch_to_words(y, sr, lyrics_lines, pitch_future)
+        finally:
+            # If a stage raised, don't leave FCPE queued or running on the GPU
+            # while the worker picks up the next song
+            if pitch_future is not None and not pitch_future.cancel():
+                wait((pitch_future,))
 
         if progress_callback:
             progress_callback(90)
@@ -1,10 +1,16 @@
 # type: ignore
+import contextlib
+import gc
 import os
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Callable, Any
 
+import torch
 from audio_separator.separator import Separator  # type: ignore
 
-from src.config import TEMP_DIR  # type: ignore
+from src.config import SEPARATOR_TORCH_COMPILE, TEMP_DIR  # type: ignore
 from src.services.s3_service import s3_service  # type: ignore
 
 
@@ -16,6 +22,43 @@ class SeparatorProcessor:
 
     def __init__(self):
         self.model_name: str = MODEL_NAME
+        self._separator: Any = None  # Lazy-loaded, reused across songs
+        self._lock = threading.Lock()
+        self._uploader = ThreadPoolExecutor(max_workers=2)  # vocals + instrumental
+
+        if torch.cuda.is_available():
+            # Fixed chunk shapes: let cuDNN autotune and allow TF32 matmuls
+            torch.backends.cudnn.benchmark = True
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+            torch.set_float32_matmul_precision("high")
+
+    def _get_separator(self, output_dir: str) -> Any:
+        """Lazy-load the Separator and its model once, then retarget output_dir per call."""
+        if self._separator is None:
+            separator: Any = Separator(
+                output_dir=output_dir,
+                output_format="FLAC",
+                use_autocast=torch.cuda.is_available(),  # fp16 autocast on GPU
+            )
+            # The roformer loader maps the checkpoint to the device but builds the
+            # module on CPU; constructing it under the device context skips the
+            # GPU -> CPU -> GPU round trip on load_state_dict
+            device = separator.torch_device
+            with device if device.type == "cuda" else contextlib.nullcontext():
+                separator.load_model(self.model_name)  # type: ignore
+            if SEPARATOR_TORCH_COMPILE and torch.cuda.is_available():
+                # demix feeds fixed-size chunks, so the compiled graph is reused
+                model_instance = separator.model_instance
+                model_instance.model_run = torch.compile(
+                    model_instance.model_run, mode="reduce-overhead"
+                )
+            self._separator = separator
+
+        # The architecture instance captures output_dir at load time
+        self._separator.output_dir = output_dir
+        self._separator.model_instance.output_dir = output_dir
+        return self._separator
 
     def separate(
         self,
@@ -38,9 +81,10 @@ class SeparatorProcessor:
         success = False
 
         try:
-            separator: Any = Separator(output_dir=output_dir, output_format="FLAC")
-            separator.load_model(self.model_name)  # type: ignore
-            output_files = separator.separate(audio_path)  # type: ignore
+            with self._lock:
+                separator = self._get_separator(output_dir)
+                with torch.inference_mode():
+                    output_files = separator.separate(audio_path)  # type: ignore
 
             # audio-separator may return relative filenames; ensure absolute paths
             output_files = [
@@ -48,6 +92,8 @@ class SeparatorProcessor:
                 for f in output_files
             ]
 
+            # Stems upload concurrently; the network wait releases the GIL
+            uploads: dict[str, Future[str]] = {}
             for output_file in output_files:
                 filename = os.path.basename(output_file).lower()
                 if "vocal" in filename:
@@ -58,29 +104,24 @@ class SeparatorProcessor:
                     continue
 
                 s3_key = f"songs/{folder_name}/{source_key}.flac"
-                url = s3_service.upload_file(output_file, s3_key)
-                results[source_key] = url
+                uploads[source_key] = self._uploader.submit(
+                    s3_service.upload_file, output_file, s3_key
+                )
+
+            # Let every upload settle before the finally block removes the files
+            wait(uploads.values())
+            for source_key, upload in uploads.items():
+                results[source_key] = upload.result()
 
             success = True
         finally:
-            for output_file in output_files:
-                if os.path.exists(output_file):
-                    try:
-                        os.remove(output_file)
-                    except OSError:
-                        pass
-
-            if os.path.exists(output_dir):
-                for file_name in os.listdir(output_dir):
-                    file_path = os.path.join(output_dir, file_name)
-                    try:
-                        os.remove(file_path)
-                    except OSError:
-                        pass
-                try:
-                    os.rmdir(output_dir)
-                except OSError:
-                    pass
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+            if not success and torch.cuda.is_available():
+                # audio-separator only clears its CUDA cache after a successful
+                # separation; drop tensors left by a failed (e.g. OOM) run too
+                gc.collect()
+                torch.cuda.empty_cache()
 
             if progress_callback and success:
                 progress_callback(100)
@@ -12,16 +12,23 @@ Output format matches the existing pipeline:
 from __future__ import annotations
 
 import gc
+import hashlib
+import json
 import logging
-import math
+import os
+import sys
+import tempfile
 import yaml
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import compress
+from typing import Dict, List, Optional, Tuple
 
-if TYPE_CHECKING:
-    import numpy as np
+import numpy as np
 
 from pathlib import Path
 
+from src.config import get_temp_dir
+
 logger = logging.getLogger(__name__)
 
 # Base directory for SOFA resources (ai-worker/sofa/)
@@ -37,11 +44,86 @@ _SOFA_HOP_LENGTH = 512
 _CHUNK_DURATION_SEC = 480  # 8 minutes per chunk
 _CHUNK_OVERLAP_SEC = 30    # 30s overlap between chunks
 
+# Model config (melspec params + training vocab); sofa/models is mounted
+# read-only in the container, so its parsed-JSON cache lives under TEMP_DIR
+_SOFA_CONFIG_PATH = SOFA_DIR / "models" / "sofa_korean_config.yaml"
+
+_model_config: Optional[dict] = None
+
+
+def _config_cache_path(config_path: Path, st: os.stat_result) -> Path:
+    """JSON cache file for *config_path*, keyed by its path, mtime and size."""
+    key = f"{config_path.resolve()}:{st.st_mtime_ns}:{st.st_size}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return Path(get_temp_dir()) / "sofa-cache" / f"{config_path.stem}.{digest}.json"
+
+
+def _load_model_config() -> dict:
+    """Load the parts of the SOFA model YAML the aligner needs.
+
+    PyYAML is slow, so the first parse is written as JSON under
+    ``TEMP_DIR/sofa-cache``, named after the YAML's path, mtime and size;
+    later cold starts load that instead while the YAML is unchanged.
+    The result is also kept in-process.
+
+    Returns:
+        ``{"melspec_config": dict, "vocab": {phoneme: index}}``, or an empty
+        dict if the YAML does not exist.
+    """
+    global _model_config
+    if _model_config is not None:
+        return _model_config
+
+    if not _SOFA_CONFIG_PATH.exists():
+        return {}
+
+    cache_path = _config_cache_path(_SOFA_CONFIG_PATH, _SOFA_CONFIG_PATH.stat())
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            _model_config = json.load(f)
+            return _model_config
+    except (OSError, ValueError):
+        pass
+
+    with open(_SOFA_CONFIG_PATH, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+
+    # Only take forward mapping: string key → int value
+    # Skip reverse mappings (int keys) and metadata (<vocab_size>)
+    vocab = {
+        key: value
+        for key, value in (config.get("vocab") or {}).items()
+        if isinstance(key, str) and isinstance(value, int) and not key.startswith("<")
+    }
+    _model_config = {
+        "melspec_config": config.get("melspec_config") or {},
+        "vocab": vocab,
+    }
+
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(_model_config, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        # TypeError/ValueError: melspec_config holds something JSON can't encode
+        logger.warning("Could not write SOFA config cache %s: %s", cache_path, e)
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    return _model_config
+
 
 class SOFAAligner:
     """Singing-oriented forced aligner using SOFA ONNX model.
 
-    Lazy-loads all heavy dependencies (numpy, soundfile, librosa, SOFA modules)
+    Lazy-loads the heavy dependencies (soundfile, soxr/librosa, SOFA modules)
     to avoid import errors in environments without GPU dependencies.
     """
 
@@ -49,6 +131,7 @@ class SOFAAligner:
         self,
         model_path: Optional[str] = None,
         device: str = "cuda",
+        quantized: bool = True,
     ) -> None:
         """Initialise the aligner.
 
@@ -56,14 +139,25 @@ class SOFAAligner:
             model_path: Path to SOFA ONNX model file. Defaults to
                 ``sofa/models/sofa_korean.onnx`` relative to the ai-worker root.
             device: ``"cuda"`` or ``"cpu"`` for ONNX Runtime provider selection.
+            quantized: On CPU, use the ``<stem>_int8.onnx`` sibling of the
+                model (see ``sofa/training/quantize_onnx.py``) if it exists.
+                Training Step 11 deletes INT8 models that fail the FP32
+                boundary check, so only vetted ones are picked up.
         """
         self._model_path = model_path or str(
             SOFA_DIR / "models" / "sofa_korean.onnx"
         )
+        if quantized and device == "cpu":
+            fp32_path = Path(self._model_path)
+            int8_path = fp32_path.with_name(f"{fp32_path.stem}_int8{fp32_path.suffix}")
+            if int8_path.exists():
+                self._model_path = str(int8_path)
         self._device = device
         self._infer_engine = None   # Lazy-loaded SOFAOnnxInfer
         self._g2p = None            # Lazy-loaded KoreanG2P
         self._ph_to_idx: Optional[dict] = None  # Lazy-loaded phoneme vocab
+        # G2P for the next chunk runs here while ONNX handles the current one
+        self._g2p_executor = ThreadPoolExecutor(max_workers=1)
 
     # ------------------------------------------------------------------
     # Lazy loaders
@@ -85,12 +179,10 @@ class SOFAAligner:
 
             # Load melspec config from model YAML to get scale_factor
             scale_factor = 1.0
-            config_path = SOFA_DIR / "models" / "sofa_korean_config.yaml"
+            config_path = _SOFA_CONFIG_PATH
             if config_path.exists():
                 try:
-                    with open(config_path, "r", encoding="utf-8") as f:
-                        config = yaml.safe_load(f)
-                    melspec_cfg = config.get("melspec_config", {})
+                    melspec_cfg = _load_model_config().get("melspec_config", {})
                     scale_factor = float(melspec_cfg.get("scale_factor", 1.0))
                     logger.info(
                         "Loaded melspec config from %s: scale_factor=%s",
@@ -131,18 +223,15 @@ class SOFAAligner:
             return self._ph_to_idx
 
         # Try loading from YAML config (ground truth from training)
-        config_path = SOFA_DIR / "models" / "sofa_korean_config.yaml"
+        config_path = _SOFA_CONFIG_PATH
         if config_path.exists():
             try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = yaml.safe_load(f)
-                vocab_section = config.get("vocab", {})
-                ph_to_idx = {}
-                for key, value in vocab_section.items():
-                    # Only take forward mapping: string key → int value
-                    # Skip reverse mappings (int keys) and metadata (<vocab_size>)
-                    if isinstance(key, str) and isinstance(value, int) and not key.startswith("<"):
-                        ph_to_idx[key] = value
+                vocab_section = _load_model_config().get("vocab", {})
+                # Intern so lookups with G2P's (literal, already
+                # interned) phonemes hit the identity fast path
+                ph_to_idx = {
+                    sys.intern(key): value for key, value in vocab_section.items()
+                }
                 if ph_to_idx:
                     self._ph_to_idx = ph_to_idx
                     logger.info(
@@ -170,12 +259,14 @@ class SOFAAligner:
                 parts = line.split("\t")
                 if len(parts) == 2:
                     phs = parts[1].split()
-                    phonemes.update(phs)
+                    phonemes.update(sys.intern(ph) for ph in phs)
 
         # SP must be index 0 (silence token); sort the rest for determinism
         phonemes.discard("SP")
         sorted_phs = ["SP"] + sorted(phonemes)
-        self._ph_to_idx = {ph: idx for idx, ph in enumerate(sorted_phs)}
+        self._ph_to_idx = {
+            ph: idx for idx, ph in enumerate(sorted_phs)
+        }
 
         logger.info(
             "Loaded phoneme vocabulary (fallback): %d phonemes from %s",
@@ -192,7 +283,8 @@ class SOFAAligner:
     def _load_audio(audio_path: str) -> "np.ndarray":
         """Load audio file and resample to 44100 Hz mono float32.
 
-        Uses soundfile for reading and librosa for resampling when needed.
+        Uses soundfile for reading and soxr for resampling when needed
+        (librosa as a fallback if soxr is unavailable).
 
         Args:
             audio_path: Path to any audio file supported by soundfile.
@@ -200,7 +292,6 @@ class SOFAAligner:
         Returns:
             1-D numpy float32 array at 44100 Hz.
         """
-        import numpy as np
         import soundfile as sf
 
         if not Path(audio_path).exists():
@@ -210,19 +301,28 @@ class SOFAAligner:
 
         # Downmix to mono
         if data.shape[1] > 1:
-            waveform = np.mean(data, axis=1)
+            waveform = np.mean(data, axis=1, dtype=np.float32)
         else:
             waveform = data[:, 0]
 
-        # Resample to SOFA sample rate if needed
+        # Resample to SOFA sample rate if needed. soxr is what librosa's
+        # default "soxr_hq" calls into; using it directly skips the librosa
+        # import (numba, scipy.signal, audioread) on the alignment path.
         if sr != _SOFA_SAMPLE_RATE:
-            import librosa
+            try:
+                import soxr
 
-            waveform = librosa.resample(
-                waveform, orig_sr=sr, target_sr=_SOFA_SAMPLE_RATE
-            )
+                waveform = soxr.resample(
+                    waveform, sr, _SOFA_SAMPLE_RATE, quality="HQ"
+                )
+            except ImportError:
+                import librosa
 
-        return waveform.astype(np.float32)
+                waveform = librosa.resample(
+                    waveform, orig_sr=sr, target_sr=_SOFA_SAMPLE_RATE
+                )
+
+        return waveform.astype(np.float32, copy=False)
 
     # ------------------------------------------------------------------
     # Core alignment
@@ -246,20 +346,19 @@ class SOFAAligner:
         Returns:
             List of word dicts with ``start_time``, ``end_time``, ``text``.
         """
-        import numpy as np
-
         engine = self._get_infer_engine()
         ph_to_idx = self._get_ph_to_idx()
 
         # Filter phonemes not in vocabulary (safety)
-        valid_ph_seq: List[str] = []
-        valid_ph_word_map: List[int] = []
-        for ph, widx in zip(ph_seq, ph_idx_to_word_idx):
-            if ph in ph_to_idx:
-                valid_ph_seq.append(ph)
-                valid_ph_word_map.append(widx)
-            else:
-                logger.warning("Phoneme %r not in vocabulary — skipping", ph)
+        keep = [ph in ph_to_idx for ph in ph_seq]
+        valid_ph_seq: List[str] = list(compress(ph_seq, keep))
+        valid_ph_word_map: List[int] = list(compress(ph_idx_to_word_idx, keep))
+        if len(valid_ph_seq) < len(ph_seq):
+            logger.warning(
+                "%d phonemes not in vocabulary — skipping: %s",
+                len(ph_seq) - len(valid_ph_seq),
+                sorted({ph for ph, k in zip(ph_seq, keep) if not k}),
+            )
 
         if len(valid_ph_seq) < 2:
             logger.warning("Too few phonemes (%d) for alignment", len(valid_ph_seq))
@@ -286,12 +385,8 @@ class SOFAAligner:
         # The returned list length equals the number of Viterbi segments,
         # which is typically == len(ph_seq).
 
-        # Aggregate phoneme timestamps to word level
-        # Group by word index from ph_idx_to_word_idx
-        word_starts: Dict[int, float] = {}
-        word_ends: Dict[int, float] = {}
-
-        # Map phoneme timestamps back to word indices
+        # Aggregate phoneme timestamps to word level:
+        # min start / max end per word index (-1 = SP boundary)
         # phoneme_timestamps[i] corresponds to valid_ph_seq[i]
         # (but Viterbi may produce fewer segments if phonemes are skipped)
         num_ts = len(phoneme_timestamps)
@@ -299,16 +394,14 @@ class SOFAAligner:
 
         if num_ts == num_ph:
             # 1:1 correspondence — ideal case
-            for i, (ph, start, end) in enumerate(phoneme_timestamps):
-                widx = valid_ph_word_map[i]
-                if widx < 0:
-                    continue  # SP boundary
-                if widx not in word_starts or start < word_starts[widx]:
-                    word_starts[widx] = start
-                if widx not in word_ends or end > word_ends[widx]:
-                    word_ends[widx] = end
+            widx = np.asarray(valid_ph_word_map, dtype=np.int32)
+            starts = np.fromiter((t[1] for t in phoneme_timestamps), dtype=np.float64, count=num_ts)
+            ends = np.fromiter((t[2] for t in phoneme_timestamps), dtype=np.float64, count=num_ts)
         else:
             # Fallback: match by phoneme string identity in order
+            matched_widx: List[int] = []
+            matched_starts: List[float] = []
+            matched_ends: List[float] = []
             ph_cursor = 0
             for ts_ph, ts_start, ts_end in phoneme_timestamps:
                 # Advance cursor to find matching phoneme
@@ -316,21 +409,31 @@ class SOFAAligner:
                     ph_cursor += 1
                 if ph_cursor >= num_ph:
                     break
-                widx = valid_ph_word_map[ph_cursor]
-                if widx >= 0:
-                    if widx not in word_starts or ts_start < word_starts[widx]:
-                        word_starts[widx] = ts_start
-                    if widx not in word_ends or ts_end > word_ends[widx]:
-                        word_ends[widx] = ts_end
+                matched_widx.append(valid_ph_word_map[ph_cursor])
+                matched_starts.append(ts_start)
+                matched_ends.append(ts_end)
                 ph_cursor += 1
+            widx = np.asarray(matched_widx, dtype=np.int32)
+            starts = np.asarray(matched_starts, dtype=np.float64)
+            ends = np.asarray(matched_ends, dtype=np.float64)
+
+        mask = widx >= 0
+        widx = widx[mask]
+        word_starts = np.full(len(word_seq), np.inf)
+        word_ends = np.full(len(word_seq), -np.inf)
+        np.minimum.at(word_starts, widx, starts[mask])
+        np.maximum.at(word_ends, widx, ends[mask])
+        has_ts = np.isfinite(word_starts).tolist()
+        start_times = np.round(word_starts, 3).tolist()
+        end_times = np.round(word_ends, 3).tolist()
 
         # Build word-level output in order
         words: List[Dict] = []
         for widx, word_text in enumerate(word_seq):
-            if widx in word_starts and widx in word_ends:
+            if has_ts[widx]:
                 words.append({
-                    "start_time": round(float(word_starts[widx]), 3),
-                    "end_time": round(float(word_ends[widx]), 3),
+                    "start_time": start_times[widx],
+                    "end_time": end_times[widx],
                     "text": word_text,
                 })
             else:
@@ -366,20 +469,14 @@ class SOFAAligner:
         if not lines:
             return [""] * num_chunks
 
-        # Distribute lines proportionally
-        lines_per_chunk = max(1, math.ceil(len(lines) / num_chunks))
-        chunks: List[str] = []
-        for i in range(num_chunks):
-            start = i * lines_per_chunk
-            end = min(start + lines_per_chunk, len(lines))
-            chunk_lines = lines[start:end]
-            chunks.append("\n".join(chunk_lines))
-
-        # Pad with empty strings if we have fewer text chunks than audio chunks
-        while len(chunks) < num_chunks:
-            chunks.append("")
-
-        return chunks
+        # Distribute lines evenly: every chunk gets floor(n / num_chunks)
+        # lines and the first (n % num_chunks) chunks get one extra, so no
+        # chunk is left empty while there are at least num_chunks lines
+        base, rem = divmod(len(lines), num_chunks)
+        bounds = [i * base + min(i, rem) for i in range(num_chunks + 1)]
+        return [
+            "\n".join(lines[bounds[i]:bounds[i + 1]]) for i in range(num_chunks)
+        ]
 
     # ------------------------------------------------------------------
     # Intro silence detection
@@ -412,8 +509,6 @@ class SOFAAligner:
             Time offset in seconds to trim from the beginning.
             Returns 0.0 if no significant intro was detected.
         """
-        import numpy as np
-
         # Compute short-hop RMS energy
         hop = 2048  # ~46ms at 44100 Hz
         frame_sec = hop / _SOFA_SAMPLE_RATE
@@ -421,46 +516,47 @@ class SOFAAligner:
         if num_frames < sustained_frames * 2:
             return 0.0
 
-        rms = np.array([
-            np.sqrt(np.mean(waveform[i * hop:(i + 1) * hop] ** 2))
-            for i in range(num_frames)
-        ])
+        # One (num_frames, hop) view instead of a Python loop over frames
+        frames = waveform[:num_frames * hop].reshape(num_frames, hop)
+        rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) * (1.0 / hop))
 
         # Two-stage threshold to handle vocal-stem bleed:
         # 1. Compute median RMS of the loudest 20% of frames (= singing level)
-        rms_sorted = np.sort(rms)
-        top20_start = int(0.80 * len(rms_sorted))
-        singing_level = float(np.median(rms_sorted[top20_start:]))
+        #    (partition is enough — the median doesn't care about order)
+        top20_start = int(0.80 * num_frames)
+        singing_level = float(np.median(np.partition(rms, top20_start)[top20_start:]))
         # 2. Threshold at 8% of singing level — catches quiet vocal entries
         #    while still ignoring low-level instrumental bleed
         threshold = singing_level * 0.08
 
-        print(f"[SOFA Trim] singing_level={singing_level:.4f}, threshold={threshold:.4f}")
+        logger.debug(
+            "[SOFA Trim] singing_level=%.4f, threshold=%.4f", singing_level, threshold
+        )
 
-        # Find first frame where RMS stays above threshold for sustained_frames
-        consecutive = 0
-        onset_frame = 0
-        for i in range(num_frames):
-            if rms[i] > threshold:
-                consecutive += 1
-                if consecutive >= sustained_frames:
-                    onset_frame = i - sustained_frames + 1
-                    break
-            else:
-                consecutive = 0
+        # Find first frame where RMS stays above threshold for sustained_frames.
+        # Current run length = count so far minus the count at the last
+        # below-threshold frame (running max of the reset points).
+        above = rms > threshold
+        count = np.cumsum(above)
+        runs = count - np.maximum.accumulate(np.where(above, 0, count))
+        hits = np.flatnonzero(runs >= sustained_frames)
+        onset_frame = int(hits[0]) - sustained_frames + 1 if len(hits) else 0
 
         onset_sec = onset_frame * frame_sec
-        print(f"[SOFA Trim] onset_frame={onset_frame}, onset_sec={onset_sec:.2f}s")
+        logger.debug(
+            "[SOFA Trim] onset_frame=%d, onset_sec=%.2fs", onset_frame, onset_sec
+        )
 
         if onset_sec < min_intro_sec:
-            print(
-                f"[SOFA Trim] Intro {onset_sec:.1f}s < {min_intro_sec:.1f}s threshold — no trim"
+            logger.debug(
+                "[SOFA Trim] Intro %.1fs < %.1fs threshold — no trim",
+                onset_sec, min_intro_sec,
             )
             return 0.0
 
         # Keep a preroll buffer to avoid clipping the first syllable
         trim_sec = max(0.0, onset_sec - preroll_sec)
-        print(f"[SOFA Trim] Trimming {trim_sec:.1f}s of intro silence")
+        logger.debug("[SOFA Trim] Trimming %.1fs of intro silence", trim_sec)
         return trim_sec
 
     # ------------------------------------------------------------------
@@ -490,8 +586,6 @@ class SOFAAligner:
 
             Returns an empty list on failure (caller should handle fallback).
         """
-        import numpy as np
-
         if language != "ko":
             logger.warning(
                 "SOFAAligner only supports Korean (ko); got %r. "
@@ -529,9 +623,7 @@ class SOFAAligner:
 
             # 4. Offset timestamps to account for trimmed intro
             if time_offset > 0 and words:
-                for w in words:
-                    w["start_time"] = round(w["start_time"] + time_offset, 3)
-                    w["end_time"] = round(w["end_time"] + time_offset, 3)
+                self._offset_words(words, time_offset)
                 logger.info(
                     "Applied +%.2fs offset to %d words", time_offset, len(words)
                 )
@@ -545,22 +637,38 @@ class SOFAAligner:
             logger.error("SOFA alignment failed", exc_info=True)
             return []
 
+    @staticmethod
+    def _offset_words(words: List[Dict], offset: float) -> None:
+        """Shift word timestamps by *offset* seconds in place (rounded to ms)."""
+        if not words:
+            return
+        times = np.array([(w["start_time"], w["end_time"]) for w in words])
+        times = np.round(times + offset, 3).tolist()
+        for w, (start, end) in zip(words, times):
+            w["start_time"] = start
+            w["end_time"] = end
+
     def _align_single(
         self,
         waveform: "np.ndarray",
         text: str,
+        g2p_future: Optional[Future] = None,
     ) -> List[Dict]:
         """Align a single (non-chunked) audio waveform to text.
 
         Args:
             waveform: Mono float32 audio at 44100 Hz.
             text: Lyrics text.
+            g2p_future: Pending ``g2p._g2p(text)`` result, if G2P was
+                already started in the background.
 
         Returns:
             Word-level alignment list.
         """
-        g2p = self._get_g2p()
-        ph_seq, word_seq, ph_idx_to_word_idx = g2p._g2p(text)
+        if g2p_future is not None:
+            ph_seq, word_seq, ph_idx_to_word_idx = g2p_future.result()
+        else:
+            ph_seq, word_seq, ph_idx_to_word_idx = self._get_g2p()._g2p(text)
 
         if not word_seq:
             logger.warning("G2P produced no words from text")
@@ -594,8 +702,6 @@ class SOFAAligner:
         Returns:
             Merged word-level alignment list.
         """
-        import numpy as np
-
         chunk_samples = int(_CHUNK_DURATION_SEC * _SOFA_SAMPLE_RATE)
         overlap_samples = int(_CHUNK_OVERLAP_SEC * _SOFA_SAMPLE_RATE)
         step_samples = chunk_samples - overlap_samples
@@ -620,6 +726,15 @@ class SOFAAligner:
         # Split text proportionally
         text_chunks = self._split_text_for_chunks(text, num_chunks)
 
+        # Queue G2P for every chunk up front; the single worker stays one
+        # chunk ahead of the (GIL-releasing) ONNX inference below
+        g2p = self._get_g2p()
+        g2p_futures = [
+            self._g2p_executor.submit(g2p._g2p, chunk_text)
+            if chunk_text.strip() else None
+            for chunk_text in text_chunks
+        ]
+
         all_words: List[Dict] = []
 
         for i, (sample_start, chunk_text) in enumerate(
@@ -642,12 +757,10 @@ class SOFAAligner:
                 len(chunk_text),
             )
 
-            chunk_words = self._align_single(audio_chunk, chunk_text)
+            chunk_words = self._align_single(audio_chunk, chunk_text, g2p_futures[i])
 
             # Offset timestamps by chunk start position
-            for word in chunk_words:
-                word["start_time"] = round(word["start_time"] + time_offset, 3)
-                word["end_time"] = round(word["end_time"] + time_offset, 3)
+            self._offset_words(chunk_words, time_offset)
 
             # For overlapping regions, only keep words from the earlier chunk
             # whose end_time falls within the non-overlapping portion
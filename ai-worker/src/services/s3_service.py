@@ -1,5 +1,7 @@
 import os
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from src.config import AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_REGION, S3_BUCKET, TEMP_DIR
 
@@ -11,8 +13,16 @@ class S3Service:
             aws_access_key_id=AWS_ACCESS_KEY_ID,
             aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
             region_name=AWS_REGION,
+            # Room for concurrent multipart parts across parallel stem uploads
+            config=Config(max_pool_connections=20),
         )
         self.bucket = S3_BUCKET
+        self.transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=10,
+            use_threads=True,
+        )
 
     def download_file(self, s3_key: str, local_path: str = None) -> str:
         if local_path is None:
@@ -35,12 +45,26 @@ class S3Service:
                 self.bucket,
                 s3_key,
                 ExtraArgs={"ContentType": self._get_content_type(local_path)},
+                Config=self.transfer_config,
             )
             return f"https://{self.bucket}.s3.{AWS_REGION}.amazonaws.com/{s3_key}"
         except ClientError as e:
             print(f"Error uploading {local_path}: {e}")
             raise
 
+    def upload_bytes(self, data: bytes, s3_key: str) -> str:
+        try:
+            self.s3_client.put_object(
+                Bucket=self.bucket,
+                Key=s3_key,
+                Body=data,
+                ContentType=self._get_content_type(s3_key),
+            )
+            return f"https://{self.bucket}.s3.{AWS_REGION}.amazonaws.com/{s3_key}"
+        except ClientError as e:
+            print(f"Error uploading {s3_key}: {e}")
+            raise
+
     def _get_content_type(self, filepath: str) -> str:
         ext = os.path.splitext(filepath)[1].lower()
         content_types = {
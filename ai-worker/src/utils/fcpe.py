@@ -0,0 +1,79 @@
+import contextlib
+import numpy as np
+import torch
+from typing import Callable, List, Optional
+
+NOTE_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+
+# FCPE emits one f0 frame per 160 samples (10ms at 16kHz)
+FCPE_HOP = 160
+
+
+def fcpe_autocast(device: str):
+    # FP16 on GPU halves activation bandwidth; CPU stays FP32 (FP16 is slow there)
+    if device == "cuda":
+        return torch.autocast(device_type="cuda", dtype=torch.float16)
+    return contextlib.nullcontext()
+
+
+def infer_f0_chunked(
+    model,
+    audio: np.ndarray,
+    sr: int,
+    device: str,
+    chunk_duration: int = 60,
+    chunk_batch_size: int = 4,
+    progress_callback: Optional[Callable[[int], None]] = None,
+) -> List[np.ndarray]:
+    """Run FCPE over fixed-length chunks of *audio*, several chunks per forward pass.
+
+    Chunking keeps CUDA memory bounded; the last chunk is zero-padded so
+    every batch has the same shape, and the frames FCPE produced for that
+    padding are dropped again.
+
+    Returns:
+        One f0 array per chunk (FCPE_HOP samples per frame, 0 = unvoiced).
+    """
+    chunk_samples = chunk_duration * sr
+    total_chunks = max(1, (len(audio) + chunk_samples - 1) // chunk_samples)
+    last_chunk_len = len(audio) - (total_chunks - 1) * chunk_samples
+
+    padded = np.zeros(total_chunks * chunk_samples, dtype=np.float32)
+    padded[:len(audio)] = audio
+    chunks = padded.reshape(total_chunks, chunk_samples)
+
+    all_pitch = []
+
+    for batch_start in range(0, total_chunks, chunk_batch_size):
+        batch = chunks[batch_start:batch_start + chunk_batch_size]
+        # FCPE requires [batch, samples, 1] shape; from_numpy shares the
+        # float32 chunk buffer, so no extra host tensor is allocated
+        audio_tensor = torch.from_numpy(batch).unsqueeze(-1)
+        if device == "cuda":
+            # Pinned host buffer lets the H2D copy run asynchronously
+            audio_tensor = audio_tensor.pin_memory().to(device, non_blocking=True)
+
+        with torch.inference_mode(), fcpe_autocast(device):
+            f0_batch = model.infer(
+                audio_tensor,
+                sr=sr,
+                decoder_mode="local_argmax",
+                threshold=0.006,
+                f0_min=65,
+                f0_max=987.77,
+                interp_uv=False,
+            )
+
+        # [batch, frames, 1] -> [batch, frames]
+        all_pitch.extend(f0_batch.squeeze(-1).float().cpu().numpy())
+
+        if progress_callback:
+            done = min(batch_start + chunk_batch_size, total_chunks)
+            progress_callback(int(done / total_chunks * 100))
+
+    # Drop the frames FCPE produced for the zero padding
+    frames_per_chunk = all_pitch[-1].shape[0]
+    last_frames = -(-last_chunk_len // FCPE_HOP)
+    all_pitch[-1] = all_pitch[-1][:min(frames_per_chunk, last_frames)]
+
+    return all_pitch
@@ -4,7 +4,7 @@ import re
 import subprocess
 import requests
 from typing import Dict, Any, Optional
-from src.config import REDIS_HOST, REDIS_PORT, QUEUE_NAMES, TEMP_DIR, BACKEND_API_URL
+from src.config import REDIS_HOST, REDIS_PORT, QUEUE_NAMES, TEMP_DIR, BACKEND_API_URL, get_temp_dir
 from src.services.rabbitmq_service import rabbitmq_service
 from src.services.s3_service import s3_service
 from src.processors.separator_processor import separator_processor
@@ -17,9 +17,13 @@ if not PROCESSING_SECRET:
     raise EnvironmentError("PROCESSING_SECRET environment variable is required")
 
 
+_UNSAFE_PATH_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WS_RE = re.compile(r'\s+')
+
+
 def sanitize_folder_name(name: str) -> str:
-    name = re.sub(r'[<>:"/\\|?*]', '', name)
-    name = re.sub(r'\s+', '_', name)
+    name = _UNSAFE_PATH_CHARS_RE.sub('', name)
+    name = _WS_RE.sub('_', name)
     name = name.strip('._')
     return name[:100] if len(name) > 100 else name
 
@@ -31,6 +35,7 @@ except ImportError:
 
 class AIWorker:
     def __init__(self):
+        get_temp_dir()
         if redis_lib:
             self.redis_client = redis_lib.Redis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True)
         else: